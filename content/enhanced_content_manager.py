@@ -162,6 +162,38 @@ def timed_cache(ttl_seconds: int = 300):
     return decorator
 
 
+class OperationStats:
+    """Running timing statistics for a single operation."""
+
+    __slots__ = ('count', 'total_time', 'success_count', 'min_time', 'max_time')
+
+    def __init__(self, duration: float):
+        self.count = 0
+        self.total_time = 0.0
+        self.success_count = 0
+        self.min_time = duration
+        self.max_time = duration
+
+    @property
+    def avg_time(self) -> float:
+        """Average duration per recorded call."""
+        return self.total_time / self.count if self.count else 0.0
+
+    @property
+    def success_rate(self) -> float:
+        """Percentage of recorded calls that succeeded."""
+        return self.success_count / self.count * 100 if self.count else 0.0
+
+    def copy(self) -> 'OperationStats':
+        """Return an independent snapshot of these statistics."""
+        clone = OperationStats(self.min_time)
+        clone.count = self.count
+        clone.total_time = self.total_time
+        clone.success_count = self.success_count
+        clone.max_time = self.max_time
+        return clone
+
+
 class PerformanceMonitor:
     """Monitor and log performance metrics."""
 
@@ -172,57 +204,60 @@ class PerformanceMonitor:
     def record_operation(self, operation: str, duration: float, success: bool = True):
         """Record operation performance."""
         with self.lock:
-            if operation not in self.metrics:
-                self.metrics[operation] = {
-                    'count': 0,
-                    'total_time': 0.0,
-                    'success_count': 0,
-                    'min_time': float('inf'),
-                    'max_time': 0.0
-                }
-
-            stats = self.metrics[operation]
-            stats['count'] += 1
-            stats['total_time'] += duration
-            stats['min_time'] = min(stats['min_time'], duration)
-            stats['max_time'] = max(stats['max_time'], duration)
+            stats = self.metrics.get(operation)
+            if stats is None:
+                stats = self.metrics[operation] = OperationStats(duration)
+
+            stats.count += 1
+            stats.total_time += duration
+            if duration < stats.min_time:
+                stats.min_time = duration
+            elif duration > stats.max_time:
+                stats.max_time = duration
 
             if success:
-                stats['success_count'] += 1
+                stats.success_count += 1
 
     def get_stats(self) -> Dict[str, Dict[str, float]]:
         """Get performance statistics."""
+        # Only copy the raw counters while holding the lock so recorders
+        # are never kept waiting on the derived-ratio arithmetic below.
         with self.lock:
-            result = {}
-            for operation, stats in self.metrics.items():
-                result[operation] = {
-                    'count': stats['count'],
-                    'avg_time': stats['total_time'] / stats['count'] if stats['count'] > 0 else 0,
-                    'min_time': stats['min_time'] if stats['min_time'] != float('inf') else 0,
-                    'max_time': stats['max_time'],
-                    'success_rate': stats['success_count'] / stats['count'] * 100 if stats['count'] > 0 else 0
-                }
-            return result
+            snapshot = [(operation, stats.copy()) for operation, stats in self.metrics.items()]
+
+        result = {}
+        for operation, stats in snapshot:
+            result[operation] = {
+                'count': stats.count,
+                'avg_time': stats.avg_time,
+                'min_time': stats.min_time,
+                'max_time': stats.max_time,
+                'success_rate': stats.success_rate
+            }
+        return result
 
 
 def performance_tracked(operation_name: str):
     """Decorator to track method performance."""
 
     def decorator(func):
+        # Bound once per decorated function to keep the timed region tight
+        perf_counter = time.perf_counter
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            start_time = time.time()
+            start_time = perf_counter()
             success = True
             try:
-                result = func(self, *args, **kwargs)
-                return result
-            except Exception as e:
+                return func(self, *args, **kwargs)
+            except Exception:
                 success = False
                 raise
             finally:
-                duration = time.time() - start_time
-                if hasattr(self, 'performance_monitor'):
-                    self.performance_monitor.record_operation(operation_name, duration, success)
+                duration = perf_counter() - start_time
+                monitor = getattr(self, 'performance_monitor', None)
+                if monitor is not None:
+                    monitor.record_operation(operation_name, duration, success)
 
                 # Log slow operations
                 if duration > 1.0:
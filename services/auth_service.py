@@ -1,14 +1,22 @@
+import copy
 import hashlib
 import jwt
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from database.db_handler import DatabaseHandler
 from config.settings import Settings
 
+# Cached settings lookups kept per instance; least recently used evicted first
+_CACHE_SIZE = 1024
+
 class AuthService:
     def __init__(self):
         self.db = DatabaseHandler()
         self.settings = Settings()
         self.secret_key = self.settings.get('auth', 'secret_key')
+        # Per-username settings cache, invalidated on every write. User
+        # records are never cached: credentials must come from the database
+        self._settings_cache = OrderedDict()
 
     def hash_password(self, password: str) -> str:
         """Hash password using SHA-256"""
@@ -17,12 +25,18 @@ class AuthService:
     def create_user(self, username: str, password: str, email: str = None) -> bool:
         """Create a new user"""
         hashed_password = self.hash_password(password)
-        return self.db.create_user(username, hashed_password, email)
+        created = self.db.create_user(username, hashed_password, email)
+        self._settings_cache.pop(username, None)
+        return created
+
+    def get_user_by_username(self, username: str) -> dict:
+        """Get user record"""
+        return self.db.get_user_by_username(username)
 
     def validate_user(self, username: str, password: str) -> bool:
         """Validate user credentials"""
         hashed_password = self.hash_password(password)
-        user = self.db.get_user_by_username(username)
+        user = self.get_user_by_username(username)
         if user and user['password_hash'] == hashed_password:
             self.db.update_user_login(user['user_id'])
             return True
@@ -61,15 +75,32 @@ class AuthService:
         return False
 
     def get_user_settings(self, username: str) -> dict:
-        """Get user settings"""
-        return self.db.get_user_settings(username)
+        """Get user settings, cached until they are next updated"""
+        try:
+            settings = self._settings_cache[username]
+            self._settings_cache.move_to_end(username)
+        except KeyError:
+            settings = self.db.get_user_settings(username)
+            if settings is None:
+                # Don't cache a miss; the user may be created elsewhere
+                return None
+            self._settings_cache[username] = settings
+            if len(self._settings_cache) > _CACHE_SIZE:
+                self._settings_cache.popitem(last=False)
+
+        # Callers may mutate the result, so never hand out the cached object
+        return copy.deepcopy(settings)
 
     def update_user_settings(self, username: str, settings: dict) -> bool:
         """Update user settings"""
-        return self.db.update_user_settings(username, settings)
+        updated = self.db.update_user_settings(username, settings)
+        self._settings_cache.pop(username, None)
+        return updated
 
     def delete_user(self, username: str, password: str) -> bool:
         """Delete user account"""
         if self.validate_user(username, password):
-            return self.db.delete_user(username)
+            deleted = self.db.delete_user(username)
+            self._settings_cache.pop(username, None)
+            return deleted
         return False
\ No newline at end of file
@@ -13,17 +13,22 @@ sys.path.insert(0, str(project_root))
 
 # Test constants
 TEST_DATA_DIR = Path(__file__).parent / 'data'
-TEST_TEMP_DIR = Path(__file__).parent / 'temp'
+# Each pytest-xdist worker gets its own temp directory so parallel runs
+# never share a database file.
+TEST_TEMP_DIR = Path(__file__).parent / 'temp' / os.environ.get('PYTEST_XDIST_WORKER', 'main')
 TEST_DB_PATH = TEST_TEMP_DIR / 'test.db'
 
 # Ensure test directories exist
 TEST_DATA_DIR.mkdir(exist_ok=True)
-TEST_TEMP_DIR.mkdir(exist_ok=True)
+TEST_TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def run_tests():
-    """Run all tests"""
-    pytest.main(['tests'])
+def run_tests(parallel=False):
+    """Run all tests, optionally spread across pytest-xdist workers"""
+    args = ['tests']
+    if parallel:
+        args += ['-n', 'auto', '--dist=loadfile']
+    pytest.main(args)
 
 
 def setup_test_environment():
@@ -33,7 +38,7 @@ def setup_test_environment():
 
     # Create test directories if they don't exist
     TEST_DATA_DIR.mkdir(exist_ok=True)
-    TEST_TEMP_DIR.mkdir(exist_ok=True)
+    TEST_TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
     # Initialize test database
     from tutorial_agent.database import init_database
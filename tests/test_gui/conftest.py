@@ -0,0 +1,40 @@
+# tests/test_gui/conftest.py
+
+import os
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from content.enhanced_content_manager import EnhancedContentManager
+from database.database_manager import DatabaseManager
+from config.settings_manager import SettingsManager
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    """Create the QApplication instance once for the whole GUI test session."""
+    if not QApplication.instance():
+        # Render offscreen unless a display is available, so CI skips the X11 handshake
+        args = [] if os.environ.get('DISPLAY') else ['-platform', 'offscreen']
+        app = QApplication(args)
+        yield app
+        app.quit()
+    else:
+        yield QApplication.instance()
+
+
+@pytest.fixture(scope="class")
+def app_components(qapp, tmp_path_factory, content_dir_factory):
+    """Setup complete application components once per test class.
+
+    The integration tests only add data and read it back, so they can
+    safely share one content manager, database and settings instance.
+    """
+    base_dir = tmp_path_factory.mktemp("integration")
+    database = DatabaseManager(base_dir / "test.db")
+    yield {
+        'content_manager': EnhancedContentManager(content_dir_factory(base_dir / "content")),
+        'database': database,
+        'settings': SettingsManager(base_dir),
+        'qapp': qapp
+    }
+    database.cleanup()
@@ -0,0 +1,47 @@
+# tests/test_gui/test_integration.py
+
+from unittest.mock import MagicMock
+
+
+class TestIntegration:
+    """Integration tests for the complete application."""
+
+    def test_content_manager_database_integration(self, app_components, sample_language_readonly):
+        """Test integration between content manager and database."""
+        content_manager = app_components['content_manager']
+        database = app_components['database']
+
+        # Save language to database
+        language_id = database.save_language(sample_language_readonly)
+
+        # Verify it can be retrieved
+        loaded_language = database.get_language(language_id)
+        assert loaded_language is not None
+        assert loaded_language.name == sample_language_readonly.name
+
+    def test_settings_content_manager_integration(self, app_components):
+        """Test integration between settings and content manager."""
+        settings = app_components['settings']
+        content_manager = app_components['content_manager']
+
+        # Update cache settings
+        settings.set('performance.cache_size_mb', 50)
+        settings.set('performance.enable_caching', True)
+
+        # Verify settings are applied
+        assert settings.get('performance.cache_size_mb') == 50
+        assert settings.get('performance.enable_caching') is True
+
+    def test_main_window_initialization(self, app_components):
+        """Test main window initialization with all components."""
+        # This would test the actual main window initialization
+        # but we use a plain stub here to avoid GUI dependencies in tests
+        mock_window = MagicMock()
+        mock_window.content_manager = app_components['content_manager']
+        mock_window.database = app_components['database']
+        mock_window.settings = app_components['settings']
+
+        # Simulate initialization
+        assert mock_window.content_manager is not None
+        assert mock_window.database is not None
+        assert mock_window.settings is not None
@@ -2,57 +2,83 @@
 Services test suite for Tutorial Agent
 """
 
+import contextlib
 import pytest
 from pathlib import Path
-import tempfile
 import json
 from typing import Dict, Any
 from unittest.mock import Mock, MagicMock, patch
 
 
+# Topic file contents shared by every test; only the level placeholders vary
+_TOPIC_TEMPLATE = json.dumps({
+    "id": "__LEVEL___topic",
+    "title": "__TITLE__ Topic",
+    "description": "Test __LEVEL__ topic content",
+    "content": "# __TITLE__ Topic Content\nTest content for __LEVEL__ topic.",
+    "examples": [
+        {
+            "title": "Example 1",
+            "code": "print('Hello, World!')",
+            "explanation": "Basic example"
+        }
+    ],
+    "exercises": [
+        {
+            "id": "ex1",
+            "title": "Exercise 1",
+            "description": "Test exercise",
+            "solution": "# Solution\npass"
+        }
+    ],
+    "quiz": {
+        "questions": [
+            {
+                "id": "q1",
+                "question": "Test question?",
+                "options": ["A", "B", "C", "D"],
+                "correct": 0
+            }
+        ]
+    }
+}, indent=2).encode()
+
+
 class ServicesTestCase:
     """Base class for service tests"""
 
+    @pytest.fixture(scope="class")
+    def services_template(self, tmp_path_factory):
+        """Build the test database and read-only content once per test class"""
+        from tutorial_agent.database import init_database
+        template_dir = tmp_path_factory.mktemp('services')
+        template_db_path = template_dir / 'test.db'
+        init_database(template_db_path)
+
+        self.test_content_dir = template_dir / 'content'
+        self.create_test_content()
+        return template_db_path.read_bytes(), self.test_content_dir
+
+    @pytest.fixture(autouse=True)
+    def setup_test_database(self, tmp_path, services_template):
+        """Give each test its own copy of the template database"""
+        template_db, self.test_content_dir = services_template
+        self.test_db_path = tmp_path / 'test.db'
+        self.test_db_path.write_bytes(template_db)
+
     def setup_method(self):
         """Set up test method"""
-        self.setup_test_database()
-        self.setup_test_content()
         self.setup_mocks()
 
     def teardown_method(self):
         """Tear down test method"""
-        self.cleanup_test_database()
-        self.cleanup_test_content()
         self.cleanup_mocks()
 
-    def setup_test_database(self):
-        """Setup test database"""
-        from tutorial_agent.database import init_database
-        self.test_db_path = Path(tempfile.mkdtemp()) / 'test.db'
-        init_database(self.test_db_path)
-
-    def cleanup_test_database(self):
-        """Cleanup test database"""
-        if hasattr(self, 'test_db_path') and self.test_db_path.exists():
-            self.test_db_path.unlink()
-            self.test_db_path.parent.rmdir()
-
-    def setup_test_content(self):
-        """Setup test content"""
-        self.test_content_dir = Path(tempfile.mkdtemp())
-        self.create_test_content()
-
-    def cleanup_test_content(self):
-        """Cleanup test content"""
-        if hasattr(self, 'test_content_dir') and self.test_content_dir.exists():
-            import shutil
-            shutil.rmtree(self.test_content_dir)
-
     def setup_mocks(self):
         """Setup service mocks"""
         self.mocks = {}
-        # Store original services to restore later
-        self.original_services = {}
+        # Every patch is undone in LIFO order when the stack closes
+        self._mock_stack = contextlib.ExitStack()
 
         # Setup mock services
         self.setup_mock_auth_service()
@@ -62,9 +88,12 @@ class ServicesTestCase:
 
     def cleanup_mocks(self):
         """Cleanup and restore original services"""
-        # Restore original services
-        for service_name, original_service in self.original_services.items():
-            setattr(self, service_name, original_service)
+        self._mock_stack.close()
+
+    def install_mock(self, service_name: str, service_mock):
+        """Patch a service attribute with a mock until cleanup_mocks runs"""
+        self.mocks[service_name] = service_mock
+        self._mock_stack.enter_context(patch.object(self, service_name, service_mock, create=True))
 
     def create_test_content(self):
         """Create test content files"""
@@ -77,40 +106,11 @@ class ServicesTestCase:
 
     def create_test_topic(self, lang_dir: Path, level: str):
         """Create test topic content"""
-        topic_data = {
-            "id": f"{level}_topic",
-            "title": f"{level.title()} Topic",
-            "description": f"Test {level} topic content",
-            "content": f"# {level.title()} Topic Content\nTest content for {level} topic.",
-            "examples": [
-                {
-                    "title": "Example 1",
-                    "code": "print('Hello, World!')",
-                    "explanation": "Basic example"
-                }
-            ],
-            "exercises": [
-                {
-                    "id": "ex1",
-                    "title": "Exercise 1",
-                    "description": "Test exercise",
-                    "solution": "# Solution\npass"
-                }
-            ],
-            "quiz": {
-                "questions": [
-                    {
-                        "id": "q1",
-                        "question": "Test question?",
-                        "options": ["A", "B", "C", "D"],
-                        "correct": 0
-                    }
-                ]
-            }
-        }
-
         topic_file = lang_dir / f"{level}.json"
-        topic_file.write_text(json.dumps(topic_data, indent=2))
+        topic_file.write_bytes(
+            _TOPIC_TEMPLATE.replace(b'__TITLE__', level.title().encode())
+                           .replace(b'__LEVEL__', level.encode())
+        )
 
     def setup_mock_auth_service(self):
         """Setup mock authentication service"""
@@ -118,9 +118,7 @@ class ServicesTestCase:
         auth_service_mock.validate_user.return_value = True
         auth_service_mock.get_user_settings.return_value = {}
 
-        self.mocks['auth_service'] = auth_service_mock
-        self.original_services['auth_service'] = getattr(self, 'auth_service', None)
-        self.auth_service = auth_service_mock
+        self.install_mock('auth_service', auth_service_mock)
 
     def setup_mock_content_service(self):
         """Setup mock content service"""
@@ -128,9 +126,7 @@ class ServicesTestCase:
         content_service_mock.get_content.return_value = {}
         content_service_mock.get_topics.return_value = []
 
-        self.mocks['content_service'] = content_service_mock
-        self.original_services['content_service'] = getattr(self, 'content_service', None)
-        self.content_service = content_service_mock
+        self.install_mock('content_service', content_service_mock)
 
     def setup_mock_quiz_service(self):
         """Setup mock quiz service"""
@@ -138,18 +134,14 @@ class ServicesTestCase:
         quiz_service_mock.get_quiz.return_value = {}
         quiz_service_mock.submit_quiz.return_value = {'score': 0, 'total': 0}
 
-        self.mocks['quiz_service'] = quiz_service_mock
-        self.original_services['quiz_service'] = getattr(self, 'quiz_service', None)
-        self.quiz_service = quiz_service_mock
+        self.install_mock('quiz_service', quiz_service_mock)
 
     def setup_mock_progress_service(self):
         """Setup mock progress service"""
         progress_service_mock = Mock()
         progress_service_mock.get_user_progress.return_value = {}
 
-        self.mocks['progress_service'] = progress_service_mock
-        self.original_services['progress_service'] = getattr(self, 'progress_service', None)
-        self.progress_service = progress_service_mock
+        self.install_mock('progress_service', progress_service_mock)
 
     def create_test_user(self) -> Dict[str, Any]:
         """Create test user"""
@@ -2,19 +2,58 @@ import pytest
 from unittest.mock import Mock, patch
 from tutorial_agent.services.auth_service import AuthService
 from tutorial_agent.database.models import User
+from database.db_handler import DatabaseHandler
 from . import ServicesTestCase
 
 
 class TestAuthService(ServicesTestCase):
+    test_user = {
+        'username': 'testuser',
+        'email': 'test@example.com',
+        'password': 'TestPass123!'
+    }
+
+    @pytest.fixture(autouse=True)
+    def isolated_database(self, setup_test_database):
+        """Bind the shared DatabaseHandler to this test's own database file
+
+        tmp_path is unique per test and per pytest-xdist worker, so the
+        auth tests can run in parallel without touching a common file.
+        """
+        DatabaseHandler().initialize(f'sqlite:///{self.test_db_path}')
+
+    @pytest.fixture(scope="class")
+    def seeded_database(self, services_template, tmp_path_factory):
+        """Template database that already holds the test user, built once per class"""
+        template_db, _ = services_template
+        seed_path = tmp_path_factory.mktemp('auth_seed') / 'seeded.db'
+        seed_path.write_bytes(template_db)
+
+        db = DatabaseHandler()
+        db.initialize(f'sqlite:///{seed_path}')
+        AuthService().create_user(
+            self.test_user['username'],
+            self.test_user['password'],
+            self.test_user['email']
+        )
+        db.engine.dispose()
+        return seed_path.read_bytes()
+
+    @pytest.fixture
+    def seeded_user(self, isolated_database, seeded_database, tmp_path):
+        """Switch this test to its own copy of the seeded database"""
+        seeded_path = tmp_path / 'seeded.db'
+        seeded_path.write_bytes(seeded_database)
+
+        db = DatabaseHandler()
+        db.engine.dispose()
+        db.initialize(f'sqlite:///{seeded_path}')
+        return self.test_user
+
     def setup_method(self):
         """Set up test method"""
         super().setup_method()
         self.auth_service = AuthService()
-        self.test_user = {
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'password': 'TestPass123!'
-        }
 
     def test_create_user_success(self):
         """Test successful user creation"""
@@ -29,15 +68,8 @@ class TestAuthService(ServicesTestCase):
         assert user is not None
         assert user['email'] == self.test_user['email']
 
-    def test_create_user_duplicate_username(self):
+    def test_create_user_duplicate_username(self, seeded_user):
         """Test user creation with duplicate username"""
-        # Create first user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Try to create duplicate user
         result = self.auth_service.create_user(
             self.test_user['username'],
@@ -47,15 +79,8 @@ class TestAuthService(ServicesTestCase):
 
         assert result == False
 
-    def test_validate_user_success(self):
+    def test_validate_user_success(self, seeded_user):
         """Test successful user validation"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Validate user
         result = self.auth_service.validate_user(
             self.test_user['username'],
@@ -64,15 +89,8 @@ class TestAuthService(ServicesTestCase):
 
         assert result == True
 
-    def test_validate_user_wrong_password(self):
+    def test_validate_user_wrong_password(self, seeded_user):
         """Test user validation with wrong password"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Validate with wrong password
         result = self.auth_service.validate_user(
             self.test_user['username'],
@@ -90,15 +108,8 @@ class TestAuthService(ServicesTestCase):
 
         assert result == False
 
-    def test_change_password_success(self):
+    def test_change_password_success(self, seeded_user):
         """Test successful password change"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Change password
         new_password = 'NewPass123!'
         result = self.auth_service.change_password(
@@ -115,15 +126,8 @@ class TestAuthService(ServicesTestCase):
             new_password
         ) == True
 
-    def test_change_password_wrong_old_password(self):
+    def test_change_password_wrong_old_password(self, seeded_user):
         """Test password change with wrong old password"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Try to change password with wrong old password
         result = self.auth_service.change_password(
             self.test_user['username'],
@@ -154,15 +158,8 @@ class TestAuthService(ServicesTestCase):
         result = self.auth_service.verify_token('invalid.token.here')
         assert result is None
 
-    def test_reset_password_request(self):
+    def test_reset_password_request(self, seeded_user):
         """Test password reset request"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Request password reset
         result = self.auth_service.reset_password(self.test_user['email'])
         assert result == True
@@ -172,27 +169,13 @@ class TestAuthService(ServicesTestCase):
         result = self.auth_service.reset_password('nonexistent@example.com')
         assert result == False
 
-    def test_get_user_settings(self):
+    def test_get_user_settings(self, seeded_user):
         """Test getting user settings"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         settings = self.auth_service.get_user_settings(self.test_user['username'])
         assert isinstance(settings, dict)
 
-    def test_update_user_settings(self):
+    def test_update_user_settings(self, seeded_user):
         """Test updating user settings"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Update settings
         new_settings = {'theme': 'dark', 'notifications': True}
         result = self.auth_service.update_user_settings(
@@ -207,15 +190,8 @@ class TestAuthService(ServicesTestCase):
         assert settings.get('theme') == 'dark'
         assert settings.get('notifications') == True
 
-    def test_delete_user_success(self):
+    def test_delete_user_success(self, seeded_user):
         """Test successful user deletion"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Delete user
         result = self.auth_service.delete_user(
             self.test_user['username'],
@@ -229,15 +205,8 @@ class TestAuthService(ServicesTestCase):
             self.test_user['username']
         ) is None
 
-    def test_delete_user_wrong_password(self):
+    def test_delete_user_wrong_password(self, seeded_user):
         """Test user deletion with wrong password"""
-        # Create user
-        self.auth_service.create_user(
-            self.test_user['username'],
-            self.test_user['password'],
-            self.test_user['email']
-        )
-
         # Try to delete with wrong password
         result = self.auth_service.delete_user(
             self.test_user['username'],
@@ -6,21 +6,17 @@ import pytest
 from pathlib import Path
 import tempfile
 import shutil
+import random
+import string
 
 
 class UtilsTestCase:
     """Base class for utility tests"""
 
-    def setup_method(self):
-        """Set up test method"""
-        # Create temporary test directory
-        self.test_dir = Path(tempfile.mkdtemp())
-        self.addCleanup(self.cleanup_test_dir)
-
-    def cleanup_test_dir(self):
-        """Clean up temporary test directory"""
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
+    @pytest.fixture(autouse=True)
+    def setup_test_dir(self, tmp_path):
+        """Provide a per-test directory, removed by pytest's tmp_path handling"""
+        self.test_dir = tmp_path
 
     def create_test_file(self, content, name="test.txt"):
         """Create a test file with content"""
@@ -94,20 +90,22 @@ def requires_temp_file(content="", suffix=".txt"):
 
 
 # Test data generators
+# Test data needs no cryptographic randomness; a seeded userspace PRNG is
+# cheaper than os.urandom and makes generated data reproducible.
+_RNG = random.Random(0)
+_RANDOM_STRING_CHARS = string.ascii_letters + string.digits
+
+
 def generate_random_string(length=10):
     """Generate random string"""
-    import string
-    import random
-    chars = string.ascii_letters + string.digits
-    return ''.join(random.choice(chars) for _ in range(length))
+    return ''.join(_RNG.choices(_RANDOM_STRING_CHARS, k=length))
 
 
 def generate_random_file(size_bytes=1024):
     """Generate random binary file"""
-    import os
-    temp_file = tempfile.NamedTemporaryFile(delete=False)
-    with open(temp_file.name, 'wb') as f:
-        f.write(os.urandom(size_bytes))
+    data = _RNG.getrandbits(size_bytes * 8).to_bytes(size_bytes, 'little') if size_bytes else b''
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(data)
     return Path(temp_file.name)
 
 
@@ -5,14 +5,8 @@ This package contains the core business logic and main classes
 for the Tutorial Agent application.
 """
 
-from pathlib import Path
 import sys
 
-# Add parent directories to path for imports
-core_dir = Path(__file__).parent
-project_root = core_dir.parent.parent
-sys.path.insert(0, str(project_root))
-
 # Import core components
 from content.content_manager import ContentManager
 from config.settings_manager import SettingsManager
@@ -62,18 +56,17 @@ class ProgressManager:
     
     def update_progress(self, user_id: str, topic_id: str, progress: float):
         """Update progress for a user on a specific topic."""
-        if user_id not in self.user_progress:
-            self.user_progress[user_id] = {}
-        self.user_progress[user_id][topic_id] = progress
+        self.user_progress.setdefault(user_id, {})[topic_id] = progress
     
     def get_progress(self, user_id: str, topic_id: str = None):
         """Get progress for a user."""
-        if user_id not in self.user_progress:
+        topics = self.user_progress.get(user_id)
+        if topics is None:
             return 0.0 if topic_id else {}
         
         if topic_id:
-            return self.user_progress[user_id].get(topic_id, 0.0)
-        return self.user_progress[user_id]
+            return topics.get(topic_id, 0.0)
+        return topics
 
 # Export all components
 __all__ = [
@@ -5,36 +5,11 @@ This package provides service layer components that handle business logic
 and data operations for the Tutorial Agent application.
 """
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 # Import services from original location
-try:
-    from services.auth_service import AuthService
-    from services.content_service import ContentService  
-    from services.quiz_service import QuizService
-    from services.progress_service import ProgressService
-except ImportError:
-    # Fallback for development
-    class AuthService:
-        def __init__(self):
-            pass
-    
-    class ContentService:
-        def __init__(self):
-            pass
-            
-    class QuizService:
-        def __init__(self):
-            pass
-            
-    class ProgressService:
-        def __init__(self):
-            pass
+from services.auth_service import AuthService
+from services.content_service import ContentService
+from services.quiz_service import QuizService
+from services.progress_service import ProgressService
 
 # Service registry
 _service_registry = {}
@@ -7,6 +7,7 @@ This package contains various utility modules for the Tutorial Agent application
 including enhanced notifications, logging helpers, and other common functionality.
 """
 
+import importlib
 import logging
 
 # Package metadata
@@ -16,25 +17,35 @@ __author__ = "Tutorial Agent Team"
 # Setup package-level logger
 logger = logging.getLogger(__name__)
 
-# Import commonly used utilities for easy access
-try:
-    from .enhanced_notifications import (
-        show_success, show_error, show_warning, show_info,
-        clear_all_notifications, show_confirmation, NotificationContext
-    )
+# Commonly used utilities, imported on first access (PEP 562) so that
+# importing a single submodule such as utils.content_loader does not pull
+# in PyQt6 through the notification helpers.
+_LAZY_ATTRIBUTES = {
+    'show_success': 'enhanced_notifications',
+    'show_error': 'enhanced_notifications',
+    'show_warning': 'enhanced_notifications',
+    'show_info': 'enhanced_notifications',
+    'post_notification': 'enhanced_notifications',
+    'clear_all_notifications': 'enhanced_notifications',
+    'show_confirmation': 'enhanced_notifications',
+    'NotificationContext': 'enhanced_notifications',
+}
+
+# Make notification functions available at package level
+__all__ = list(_LAZY_ATTRIBUTES)
 
-    # Make notification functions available at package level
-    __all__ = [
-        'show_success', 'show_error', 'show_warning', 'show_info',
-        'clear_all_notifications', 'show_confirmation', 'NotificationContext'
-    ]
 
-    logger.debug("Enhanced notifications module loaded successfully")
+def __getattr__(name):
+    """Import lazily exported utilities on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-except ImportError as e:
-    logger.warning(f"Could not import enhanced_notifications: {e}")
-    # Provide fallback functions if the enhanced notifications fail
-    __all__ = []
+    module = importlib.import_module(f'.{module_name}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    logger.debug(f"Loaded {name} from {module_name}")
+    return value
 
 
 def get_version():
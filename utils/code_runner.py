@@ -1,19 +1,168 @@
+import ast
+import atexit
+import functools
+import hashlib
 import subprocess
 import os
 import tempfile
 import sys
 import threading
-import queue
 import time
+import queue
+import json
+import re
+import select
+import selectors
+import shutil
+import signal
+import struct
 from typing import Dict, Tuple, Optional
 from pathlib import Path
 
 
+# Validation tables, built once at import
+_JAVA_STRUCTURE_RE = re.compile(r'public\s+class\s+(\w+)|public\s+static\s+void\s+main')
+_PY_DANGEROUS = ('os', 'subprocess', 'sys', 'shutil')
+_CPP_DANGEROUS = ('<fstream>', '<filesystem>')
+_CPP_CACHE_SIZE = 32
+_MAX_OUTPUT = 1 << 20  # output kept from a single run before it is cut off
+_READ_CHUNK = 1 << 16
+_PYTHON_MEMORY_LIMIT = 512 << 20
+_TRUNCATED_NOTICE = f'\n... output truncated at {_MAX_OUTPUT} bytes'
+
+
+# Children get their own session so a timeout can take down everything
+# they spawned (g++ drivers, subprocesses started by user code)
+_NEW_SESSION = {'start_new_session': True} if os.name == 'posix' else {}
+
+
+def _kill_process_tree(process: subprocess.Popen):
+    """Kill a process started with _NEW_SESSION together with its descendants"""
+    if os.name == 'posix':
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+    process.kill()
+
+
+@functools.lru_cache(maxsize=64)
+def _analyze_java(code: str) -> Tuple[Optional[str], bool]:
+    """Return the public class name and whether a main method exists, in one scan"""
+    class_name = None
+    has_main = False
+    for match in _JAVA_STRUCTURE_RE.finditer(code):
+        if match.group(1) is None:
+            has_main = True
+        elif class_name is None:
+            class_name = match.group(1)
+        if class_name is not None and has_main:
+            break
+    return class_name, has_main
+
+
+# Main loop of a pooled Python interpreter. Requests and replies are JSON
+# documents prefixed with a 4-byte big-endian length. The worker itself never
+# runs user code: on POSIX each snippet runs in a forked child, so module
+# patches, recursion limits and the like die with it; elsewhere the worker
+# runs one snippet and exits so the pool replaces it. The snippet gets fresh
+# globals, a private working directory, and fds 0/1/2 on anonymous temporary
+# files, so output from os.system and subprocesses is captured too. Each
+# output file is capped with RLIMIT_FSIZE and the address space with
+# RLIMIT_AS where the platform supports rlimits.
+_PYTHON_WORKER_SOURCE = '''
+import errno, io, json, os, shutil, struct, sys, tempfile, traceback
+try:
+    import resource, signal
+except ImportError:
+    resource = None
+MEMORY_LIMIT = int(sys.argv[1])
+FORK = hasattr(os, "fork")
+dumps, loads, pack, unpack = json.dumps, json.loads, struct.pack, struct.unpack
+read = sys.stdin.buffer.read
+reply_stream = os.fdopen(os.dup(1), "wb")
+os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+def std_stream(fd):
+    return io.TextIOWrapper(open(fd, "wb", buffering=0, closefd=False),
+                            encoding="utf-8", errors="replace", write_through=True)
+def execute(code, limit, files, run_dir):
+    for fd, f in enumerate(files):
+        os.dup2(f.fileno(), fd)
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout, sys.stderr = std_stream(1), std_stream(2)
+    os.chdir(run_dir)
+    if resource is not None:
+        signal.signal(signal.SIGXFSZ, signal.SIG_IGN)
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (MEMORY_LIMIT, MEMORY_LIMIT))
+            resource.setrlimit(resource.RLIMIT_FSIZE, (limit, limit))
+        except (ValueError, OSError):
+            pass
+    try:
+        exec(compile(code, "<string>", "exec"), {"__name__": "__main__"})
+    except SystemExit as e:
+        if e.code is not None and not isinstance(e.code, int):
+            print(e.code, file=sys.stderr)
+    except OSError as e:
+        if e.errno != errno.EFBIG:
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+    except BaseException as e:
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+def collect(f, limit):
+    size = os.fstat(f.fileno()).st_size
+    f.seek(0)
+    return f.read(limit).decode("utf-8", "replace"), size >= limit
+while True:
+    header = read(4)
+    if len(header) < 4:
+        break
+    request = loads(read(unpack(">I", header)[0]))
+    limit = request["limit"]
+    files = [tempfile.TemporaryFile() for _ in range(3)]
+    files[0].write(request["stdin"].encode("utf-8"))
+    files[0].seek(0)
+    run_dir = tempfile.mkdtemp(prefix="py_run_", dir=os.getcwd())
+    signaled = None
+    if FORK:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                reply_stream.close()
+                execute(request["code"], limit, files, run_dir)
+            finally:
+                os._exit(0)
+        status = os.waitpid(pid, 0)[1]
+        if os.WIFSIGNALED(status):
+            signaled = os.WTERMSIG(status)
+    else:
+        home = os.getcwd()
+        execute(request["code"], limit, files, run_dir)
+        os.chdir(home)
+    stdout, out_truncated = collect(files[1], limit)
+    stderr, err_truncated = collect(files[2], limit)
+    if signaled is not None:
+        stderr += "Process terminated by signal %d\\n" % signaled
+    for f in files:
+        f.close()
+    shutil.rmtree(run_dir, ignore_errors=True)
+    reply = dumps({"stdout": stdout, "stderr": stderr,
+                   "truncated": out_truncated or err_truncated,
+                   "recycle": not FORK}).encode()
+    reply_stream.write(pack(">I", len(reply)) + reply)
+    reply_stream.flush()
+    if not FORK:
+        break
+'''
+
+
 class CodeRunner:
-    def __init__(self, timeout: int = 5):
+    def __init__(self, timeout: int = 5, python_workers: int = 2):
         self.timeout = timeout
         self.temp_dir = Path(tempfile.gettempdir()) / 'tutorial_agent'
         self.temp_dir.mkdir(exist_ok=True)
+        self._cpp_cache_dir = self.temp_dir / 'cpp_cache'
+        self._cpp_cache_dir.mkdir(exist_ok=True)
 
         self.language_configs = {
             'python': {
@@ -38,6 +187,17 @@ class CodeRunner:
             }
         }
 
+        # Pre-warmed interpreters so Python snippets skip interpreter start-up.
+        # Extra workers started for concurrent runs are stopped on release
+        self._python_workers = queue.Queue(maxsize=max(1, python_workers))
+        for _ in range(python_workers):
+            worker = self._spawn_python_worker()
+            if worker is not None:
+                self._python_workers.put(worker)
+
+        # Registered with the queue rather than self so the runner can still be collected
+        atexit.register(self._close_workers, self._python_workers)
+
     def run_code(self, code: str, language: str, input_data: str = '') -> Dict:
         """Run code and return result"""
         if language not in self.language_configs:
@@ -47,20 +207,35 @@ class CodeRunner:
             }
 
         try:
+            if language == 'python':
+                result = self._run_python_in_worker(code, input_data)
+                if result is not None:
+                    output, error = result
+                    if error:
+                        return {
+                            'status': 'error',
+                            'error': error
+                        }
+                    return {
+                        'status': 'success',
+                        'output': output
+                    }
+
             # Create temporary file
             file_path = self._create_temp_file(code, language)
 
-            # Compile if necessary
-            if self.language_configs[language]['compile_command']:
-                compile_result = self._compile_code(file_path, language)
-                if compile_result.get('status') == 'error':
-                    return compile_result
-
-            # Run the code
-            output, error = self._execute_code(file_path, language, input_data)
-
-            # Clean up
-            self._cleanup(file_path)
+            try:
+                # Compile if necessary
+                if self.language_configs[language]['compile_command']:
+                    compile_result = self._compile_code(file_path, language)
+                    if compile_result.get('status') == 'error':
+                        return compile_result
+
+                # Run the code
+                output, error = self._execute_code(file_path, language, input_data)
+            finally:
+                # Clean up
+                self._cleanup(file_path)
 
             if error:
                 return {
@@ -79,27 +254,155 @@ class CodeRunner:
                 'error': str(e)
             }
 
+    def _spawn_python_worker(self) -> Optional[subprocess.Popen]:
+        """Start a pooled Python interpreter, or None if it cannot be started"""
+        # Snippet directories live under a per-worker directory, so runs cut
+        # short by a timeout are still cleaned up when the worker is retired
+        work_dir = tempfile.mkdtemp(prefix='pyworker_', dir=self.temp_dir)
+        try:
+            worker = subprocess.Popen(
+                [self.language_configs['python']['command'], '-c', _PYTHON_WORKER_SOURCE,
+                 str(_PYTHON_MEMORY_LIMIT)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                cwd=work_dir,
+                **_NEW_SESSION
+            )
+        except OSError:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return None
+        worker.work_dir = work_dir
+        return worker
+
+    def _run_python_in_worker(self, code: str,
+                              input_data: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Run Python code on a pooled interpreter
+
+        Returns None when no worker could take the request, so the caller
+        falls back to running a temporary file.
+        """
+        try:
+            worker = self._python_workers.get_nowait()
+        except queue.Empty:
+            worker = self._spawn_python_worker()
+        if worker is None:
+            return None
+        if worker.poll() is not None:
+            self._replace_python_worker(worker)
+            return None
+
+        request = json.dumps({
+            'code': code,
+            'stdin': input_data or '',
+            'limit': _MAX_OUTPUT
+        }).encode()
+        timed_out = threading.Event()
+
+        def on_timeout():
+            timed_out.set()
+            _kill_process_tree(worker)
+
+        watchdog = threading.Timer(self.timeout, on_timeout)
+        watchdog.start()
+        try:
+            worker.stdin.write(struct.pack('>I', len(request)) + request)
+            worker.stdin.flush()
+            header = worker.stdout.read(4)
+            reply = worker.stdout.read(struct.unpack('>I', header)[0]) if len(header) == 4 else b''
+        except OSError:
+            reply = b''
+        finally:
+            watchdog.cancel()
+
+        if not reply:
+            # The worker is gone; replace it so the pool stays warm
+            self._replace_python_worker(worker)
+            if timed_out.is_set():
+                return '', 'Execution timeout'
+            return '', 'Python worker exited unexpectedly'
+
+        # Validate before the worker goes back into the pool
+        try:
+            result = json.loads(reply)
+            output, error = result['stdout'], result['stderr']
+            if not (isinstance(output, str) and isinstance(error, str)):
+                raise TypeError('malformed reply')
+            truncated, recycle = bool(result['truncated']), bool(result.get('recycle'))
+        except (ValueError, KeyError, TypeError):
+            self._replace_python_worker(worker)
+            return '', 'Python worker returned an invalid reply'
+
+        if recycle:
+            # The worker ran the snippet in-process and has exited
+            self._replace_python_worker(worker)
+        else:
+            self._release_python_worker(worker)
+
+        if truncated:
+            output += _TRUNCATED_NOTICE
+        return output, error or None
+
+    def _replace_python_worker(self, worker: subprocess.Popen):
+        """Retire a worker and put a fresh one in the pool if it has room"""
+        _kill_process_tree(worker)
+        self._stop_python_worker(worker)
+        if not self._python_workers.full():
+            replacement = self._spawn_python_worker()
+            if replacement is not None:
+                self._release_python_worker(replacement)
+
+    def _release_python_worker(self, worker: subprocess.Popen):
+        """Return a worker to the pool, or stop it when the pool is full"""
+        try:
+            self._python_workers.put_nowait(worker)
+        except queue.Full:
+            self._stop_python_worker(worker)
+
+    @staticmethod
+    def _stop_python_worker(worker: subprocess.Popen):
+        """Let a worker exit, then release its pipes and directory"""
+        try:
+            worker.stdin.close()
+            worker.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            _kill_process_tree(worker)
+            worker.wait()
+        worker.stdout.close()
+        shutil.rmtree(worker.work_dir, ignore_errors=True)
+
+    def close(self):
+        """Shut down pooled interpreters"""
+        self._close_workers(self._python_workers)
+
+    @staticmethod
+    def _close_workers(workers: queue.Queue):
+        """Stop every idle worker in the pool"""
+        while True:
+            try:
+                worker = workers.get_nowait()
+            except queue.Empty:
+                break
+            CodeRunner._stop_python_worker(worker)
+
     def _create_temp_file(self, code: str, language: str) -> Path:
         """Create temporary file with the code"""
         config = self.language_configs[language]
         extension = config['extension']
 
-        # Create unique file name
-        timestamp = int(time.time() * 1000)
-        file_name = f"code_{timestamp}{extension}"
-        file_path = self.temp_dir / file_name
+        # Each run gets its own directory, so build products such as a.out
+        # never collide between concurrent runs
+        run_dir = Path(tempfile.mkdtemp(prefix='run_', dir=self.temp_dir))
+        file_name = f"code{extension}"
 
         # Handle Java class name
         if language == 'java':
-            # Extract class name from code
+            # javac requires the file to be named after the public class
             class_name = self._extract_java_class_name(code)
             if class_name:
                 file_name = f"{class_name}{extension}"
-                file_path = self.temp_dir / file_name
 
-        # Write code to file
-        with open(file_path, 'w') as f:
-            f.write(code)
+        file_path = run_dir / file_name
+        file_path.write_bytes(code.encode('utf-8'))
 
         return file_path
 
@@ -111,13 +414,32 @@ class CodeRunner:
         if not compile_command:
             return {'status': 'success'}
 
+        binary = None
+        if language == 'cpp':
+            # Identical snippets reuse the executable built last time
+            digest = hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+            binary = self._cpp_cache_dir / digest
+            if binary.exists():
+                os.utime(binary)
+                self._link_cpp_binary(binary, file_path.parent / 'a.out')
+                return {'status': 'success'}
+
+        build = None
         try:
             compile_command = compile_command.format(file_path=file_path)
+            if binary is not None:
+                # A private output name keeps concurrent identical compiles apart
+                fd, build = tempfile.mkstemp(
+                    prefix=f'{digest}.', suffix='.tmp', dir=self._cpp_cache_dir
+                )
+                os.close(fd)
+                compile_command = f"{compile_command} -o {build}"
             process = subprocess.Popen(
                 compile_command.split(),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                cwd=file_path.parent
+                cwd=file_path.parent,
+                **_NEW_SESSION
             )
 
             _, stderr = process.communicate(timeout=self.timeout)
@@ -128,10 +450,18 @@ class CodeRunner:
                     'error': f"Compilation error:\n{stderr.decode()}"
                 }
 
+            if binary is not None:
+                # Publish only complete builds to the cache
+                os.replace(build, binary)
+                build = None
+                self._link_cpp_binary(binary, file_path.parent / 'a.out')
+                self._evict_cpp_cache()
+
             return {'status': 'success'}
 
         except subprocess.TimeoutExpired:
-            process.kill()
+            _kill_process_tree(process)
+            process.wait()
             return {
                 'status': 'error',
                 'error': 'Compilation timeout'
@@ -141,6 +471,36 @@ class CodeRunner:
                 'status': 'error',
                 'error': f'Compilation error: {str(e)}'
             }
+        finally:
+            if build is not None:
+                Path(build).unlink(missing_ok=True)
+
+    def _link_cpp_binary(self, binary: Path, target: Path):
+        """Point the executable the runner launches at a cached build"""
+        target.unlink(missing_ok=True)
+        try:
+            target.symlink_to(binary)
+        except OSError:
+            shutil.copy2(binary, target)
+
+    def _evict_cpp_cache(self):
+        """Drop the least recently used C++ builds beyond the cache size"""
+        builds = []
+        # Partial outputs older than any live compile were left by a crash
+        tmp_cutoff = time.time() - 2 * self.timeout
+        for path in self._cpp_cache_dir.iterdir():
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if path.suffix == '.tmp':
+                if mtime < tmp_cutoff:
+                    path.unlink(missing_ok=True)
+            elif not path.suffix:
+                builds.append((mtime, path))
+        builds.sort(reverse=True)
+        for _, stale in builds[_CPP_CACHE_SIZE:]:
+            stale.unlink(missing_ok=True)
 
     def _execute_code(self, file_path: Path, language: str,
                       input_data: str) -> Tuple[str, Optional[str]]:
@@ -153,68 +513,113 @@ class CodeRunner:
         elif language == 'java':
             command = f"{command} {file_path.stem}"
 
-        # Create queue for output
-        output_queue = queue.Queue()
-        error_queue = queue.Queue()
-
-        def target():
-            try:
-                process = subprocess.Popen(
-                    command.split(),
-                    stdin=subprocess.PIPE if input_data else None,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    cwd=file_path.parent
-                )
-
-                stdout, stderr = process.communicate(
-                    input=input_data.encode() if input_data else None,
-                    timeout=self.timeout
-                )
-
-                output_queue.put(stdout.decode())
-                if stderr:
-                    error_queue.put(stderr.decode())
-
-            except Exception as e:
-                error_queue.put(str(e))
-
-        # Run execution in separate thread
-        thread = threading.Thread(target=target)
-        thread.start()
-        thread.join(timeout=self.timeout)
+        try:
+            process = subprocess.Popen(
+                command.split(),
+                stdin=subprocess.PIPE if input_data else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=file_path.parent,
+                **_NEW_SESSION
+            )
+        except Exception as e:
+            return '', str(e)
 
-        if thread.is_alive():
-            thread.join()
+        try:
+            stdout, stderr, truncated = self._communicate_capped(
+                process, (input_data or '').encode('utf-8')
+            )
+        except subprocess.TimeoutExpired:
+            _kill_process_tree(process)
+            process.wait()
             return '', 'Execution timeout'
+        except Exception as e:
+            _kill_process_tree(process)
+            process.wait()
+            return '', str(e)
+
+        output = stdout.decode('utf-8', errors='replace')
+        if truncated:
+            output += _TRUNCATED_NOTICE
+        return output, stderr.decode('utf-8', errors='replace') or None
+
+    def _communicate_capped(self, process: subprocess.Popen,
+                            input_data: bytes) -> Tuple[bytes, bytes, bool]:
+        """Like communicate(), but stop and kill the process past _MAX_OUTPUT bytes
+
+        Returns (stdout, stderr, truncated). Raises subprocess.TimeoutExpired
+        when the process outlives self.timeout.
+        """
+        if os.name != 'posix':
+            # Pipes cannot be polled with select() on Windows
+            stdout, stderr = process.communicate(input=input_data or None, timeout=self.timeout)
+            truncated = len(stdout) + len(stderr) > _MAX_OUTPUT
+            return stdout[:_MAX_OUTPUT], stderr[:max(0, _MAX_OUTPUT - len(stdout))], truncated
+
+        deadline = time.monotonic() + self.timeout
+        chunks = {process.stdout.fileno(): [], process.stderr.fileno(): []}
+        remaining = _MAX_OUTPUT
+        truncated = False
 
-        # Get results
-        output = output_queue.get() if not output_queue.empty() else ''
-        error = error_queue.get() if not error_queue.empty() else None
-
-        return output, error
+        try:
+            with selectors.DefaultSelector() as selector:
+                for fd in chunks:
+                    selector.register(fd, selectors.EVENT_READ)
+                if process.stdin:
+                    if input_data:
+                        selector.register(process.stdin.fileno(), selectors.EVENT_WRITE)
+                    else:
+                        process.stdin.close()
+
+                offset = 0
+                while selector.get_map():
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        raise subprocess.TimeoutExpired(process.args, self.timeout)
+
+                    for key, _ in selector.select(timeout):
+                        if key.fd not in chunks:
+                            # Feed stdin without blocking on a child that is busy writing
+                            try:
+                                offset += os.write(key.fd, input_data[offset:offset + select.PIPE_BUF])
+                            except BrokenPipeError:
+                                offset = len(input_data)
+                            if offset >= len(input_data):
+                                selector.unregister(key.fd)
+                                process.stdin.close()
+                            continue
+
+                        data = os.read(key.fd, _READ_CHUNK)
+                        if not data:
+                            selector.unregister(key.fd)
+                            continue
+                        chunks[key.fd].append(data[:remaining])
+                        remaining -= len(data)
+                        if remaining <= 0:
+                            truncated = True
+                            break
+
+                    if truncated:
+                        _kill_process_tree(process)
+                        break
+
+            process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            stdout, stderr = (b''.join(parts) for parts in chunks.values())
+            return stdout, stderr, truncated
+        finally:
+            # As communicate() does, release the pipes rather than leave them to GC
+            for pipe in (process.stdin, process.stdout, process.stderr):
+                if pipe:
+                    pipe.close()
 
     def _cleanup(self, file_path: Path):
         """Clean up temporary files"""
-        try:
-            if file_path.exists():
-                file_path.unlink()
-
-            # Clean up compiled files
-            if file_path.suffix == '.cpp':
-                (file_path.parent / 'a.out').unlink(missing_ok=True)
-            elif file_path.suffix == '.class':
-                (file_path.parent / f"{file_path.stem}.class").unlink(missing_ok=True)
-
-        except Exception:
-            pass  # Ignore cleanup errors
+        # The source and everything built from it live in the run directory
+        shutil.rmtree(file_path.parent, ignore_errors=True)
 
     def _extract_java_class_name(self, code: str) -> Optional[str]:
         """Extract Java class name from code"""
-        import re
-        pattern = r'public\s+class\s+(\w+)'
-        match = re.search(pattern, code)
-        return match.group(1) if match else None
+        return _analyze_java(code)[0]
 
     def validate_code(self, code: str, language: str) -> Dict:
         """Validate code before execution"""
@@ -251,18 +656,24 @@ class CodeRunner:
             'errors': []
         }
 
-        # Check for syntax errors
+        # Check for syntax errors; parsing stops short of generating bytecode
         try:
-            compile(code, '<string>', 'exec')
+            tree = ast.parse(code, '<string>')
         except SyntaxError as e:
             result['is_valid'] = False
             result['errors'].append(f'Syntax error: {str(e)}')
             return result
 
         # Check for potentially dangerous operations
-        dangerous_modules = ['os', 'subprocess', 'sys', 'shutil']
-        for module in dangerous_modules:
-            if f'import {module}' in code or f'from {module}' in code:
+        imported = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                imported.update(alias.name.split('.')[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                imported.add(node.module.split('.')[0])
+
+        for module in _PY_DANGEROUS:
+            if module in imported:
                 result['warnings'].append(
                     f'Code contains potentially dangerous module: {module}'
                 )
@@ -277,13 +688,15 @@ class CodeRunner:
             'errors': []
         }
 
+        class_name, has_main = _analyze_java(code)
+
         # Check for public class
-        if 'public class' not in code:
+        if class_name is None:
             result['is_valid'] = False
             result['errors'].append('Java code must contain a public class')
 
         # Check for main method
-        if 'public static void main' not in code:
+        if not has_main:
             result['is_valid'] = False
             result['errors'].append('Java code must contain a main method')
 
@@ -303,8 +716,7 @@ class CodeRunner:
             result['errors'].append('C++ code must contain a main function')
 
         # Check for includes
-        dangerous_headers = ['<fstream>', '<filesystem>']
-        for header in dangerous_headers:
+        for header in _CPP_DANGEROUS:
             if header in code:
                 result['warnings'].append(
                     f'Code contains potentially dangerous header: {header}'
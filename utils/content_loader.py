@@ -1,10 +1,11 @@
 from pathlib import Path
-from typing import Dict, List, Optional
-import json
+from typing import Dict, List, Optional, Tuple
 import importlib
 import logging
-from dataclasses import asdict
-from content.models import Language, Topic, Example, Exercise
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from content.models import Language, Topic
 
 
 class ContentManager:
@@ -13,16 +14,31 @@ class ContentManager:
     def __init__(self):
         self.content_path = Path("content/languages")
         self.languages: Dict[str, Language] = {}
+        self._topic_index: Dict[str, Dict[Tuple[str, ...], Topic]] = {}
+        self._search_entries: Dict[str, List[Tuple[str, Dict]]] = {}
+        self._lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
 
     def load_all_content(self):
         """Load content for all supported programming languages."""
-        for lang_dir in self.content_path.iterdir():
-            if lang_dir.is_dir():
+        lang_names = [d.name for d in self.content_path.iterdir() if d.is_dir()]
+        if not lang_names:
+            return
+
+        # Languages are independent and mostly I/O bound, so load them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(lang_names)),
+                                thread_name_prefix="ContentLoader") as executor:
+            futures = [executor.submit(self._load_language_content, name) for name in lang_names]
+            for name, future in zip(lang_names, futures):
                 try:
-                    self._load_language_content(lang_dir.name)
+                    future.result()
                 except Exception as e:
-                    self.logger.error(f"Error loading content for {lang_dir.name}: {str(e)}")
+                    self.logger.error(f"Error loading content for {name}: {str(e)}")
+
+        # Workers register languages as they finish; restore directory order
+        with self._lock:
+            loaded = {name: self.languages.pop(name) for name in lang_names if name in self.languages}
+            self.languages.update(loaded)
 
     def _load_language_content(self, language: str):
         """Load content for a specific programming language."""
@@ -34,9 +50,9 @@ class ContentManager:
             # Each language module should have a create_content function
             if hasattr(lang_module, 'create_content'):
                 language_content = lang_module.create_content()
-                self.languages[language] = language_content
+                self._store_language(language, language_content)
 
-                # Save content to JSON for caching
+                # Save content to disk for caching
                 self._cache_content(language, language_content)
             else:
                 raise AttributeError(f"No create_content function found in {module_path}")
@@ -46,148 +62,115 @@ class ContentManager:
             # Try loading from cache
             cached_content = self._load_cached_content(language)
             if cached_content:
-                self.languages[language] = cached_content
+                self._store_language(language, cached_content)
+
+    def _store_language(self, language: str, content: Language):
+        """Register loaded content and rebuild its lookup and search indexes."""
+        with self._lock:
+            self.languages[language] = content
+            self._build_topic_index(language)
+            self._build_search_entries(language)
+
+    def _build_topic_index(self, language: str):
+        """Index every topic of a language by its title path."""
+        index: Dict[Tuple[str, ...], Topic] = {}
+        stack = [((topic.title,), topic) for topic in reversed(self.languages[language].topics)]
+        while stack:
+            path, topic = stack.pop()
+            # First sibling with a given title wins, as in a linear walk
+            if path in index:
+                continue
+            index[path] = topic
+            stack.extend((path + (sub.title,), sub) for sub in reversed(topic.subtopics))
+        self._topic_index[language] = index
+
+    def _build_search_entries(self, language: str):
+        """Precompute lowercased searchable text for a language.
+
+        Each entry's fields are joined with NUL so a search is one substring
+        scan per entry; queries never contain NUL, so they cannot match
+        across the field boundary.
+        """
+        name = self.languages[language].name
+        entries: List[Tuple[str, Dict]] = []
+
+        # Walk the topic tree with an explicit stack, in pre-order
+        stack = list(reversed(self.languages[language].topics))
+        while stack:
+            topic = stack.pop()
+            entries.append((f'{topic.title}\0{topic.content}'.lower(), {
+                'language': name,
+                'topic': topic.title,
+                'type': 'topic',
+                'description': topic.description
+            }))
+
+            for example in topic.examples:
+                entries.append((f'{example.title}\0{example.description}'.lower(), {
+                    'language': name,
+                    'topic': topic.title,
+                    'type': 'example',
+                    'description': example.title
+                }))
+
+            for exercise in topic.exercises:
+                entries.append((f'{exercise.title}\0{exercise.description}'.lower(), {
+                    'language': name,
+                    'topic': topic.title,
+                    'type': 'exercise',
+                    'description': exercise.title
+                }))
+
+            stack.extend(reversed(topic.subtopics))
+
+        self._search_entries[language] = entries
 
     def _cache_content(self, language: str, content: Language):
-        """Cache language content to JSON file."""
+        """Cache language content to a pickle file."""
         cache_dir = Path("content/cache")
         cache_dir.mkdir(parents=True, exist_ok=True)
 
-        cache_file = cache_dir / f"{language}.json"
+        cache_file = cache_dir / f"{language}.pickle"
         try:
-            with cache_file.open('w') as f:
-                json.dump(asdict(content), f, indent=2)
+            data = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+            with cache_file.open('wb') as f:
+                f.write(data)
         except Exception as e:
             self.logger.error(f"Error caching content for {language}: {str(e)}")
 
     def _load_cached_content(self, language: str) -> Optional[Language]:
         """Load language content from cache."""
-        cache_file = Path("content/cache") / f"{language}.json"
+        cache_file = Path("content/cache") / f"{language}.pickle"
         if cache_file.exists():
             try:
-                with cache_file.open('r') as f:
-                    data = json.load(f)
-                    return self._deserialize_language(data)
+                with cache_file.open('rb') as f:
+                    return pickle.load(f)
             except Exception as e:
                 self.logger.error(f"Error loading cached content for {language}: {str(e)}")
         return None
 
-    def _deserialize_language(self, data: dict) -> Language:
-        """Convert JSON data back to Language object."""
-        return Language(
-            name=data['name'],
-            description=data['description'],
-            topics=[self._deserialize_topic(t) for t in data['topics']],
-            prerequisites=data['prerequisites'],
-            learning_path=data['learning_path'],
-            resources=data['resources']
-        )
-
-    def _deserialize_topic(self, data: dict) -> Topic:
-        """Convert JSON data back to Topic object."""
-        return Topic(
-            title=data['title'],
-            description=data['description'],
-            content=data['content'],
-            examples=[self._deserialize_example(e) for e in data['examples']],
-            best_practices=data['best_practices'],
-            exercises=[self._deserialize_exercise(e) for e in data['exercises']],
-            subtopics=[self._deserialize_topic(st) for st in data['subtopics']]
-        )
-
-    def _deserialize_example(self, data: dict) -> Example:
-        """Convert JSON data back to Example object."""
-        return Example(
-            title=data['title'],
-            description=data['description'],
-            code=data['code'],
-            output=data.get('output'),
-            explanation=data.get('explanation')
-        )
-
-    def _deserialize_exercise(self, data: dict) -> Exercise:
-        """Convert JSON data back to Exercise object."""
-        return Exercise(
-            title=data['title'],
-            description=data['description'],
-            starter_code=data['starter_code'],
-            solution=data['solution'],
-            hints=data['hints'],
-            test_cases=data['test_cases'],
-            difficulty=data['difficulty']
-        )
-
     def get_language_content(self, language: str) -> Optional[Language]:
         """Get content for a specific language."""
         return self.languages.get(language)
 
     def get_topic_content(self, language: str, topic_path: List[str]) -> Optional[Topic]:
         """Get content for a specific topic within a language."""
-        language_content = self.get_language_content(language)
-        if not language_content:
+        if not topic_path:
             return None
-
-        current_topic = None
-        current_topics = language_content.topics
-
-        for topic_name in topic_path:
-            for topic in current_topics:
-                if topic.title == topic_name:
-                    current_topic = topic
-                    current_topics = topic.subtopics
-                    break
-            else:
-                return None
-
-        return current_topic
+        return self._topic_index.get(language, {}).get(tuple(topic_path))
 
     def search_content(self, query: str) -> List[Dict]:
         """Search through all content."""
+        query = query.lower()
         results = []
 
-        for language in self.languages.values():
-            for topic in language.topics:
-                self._search_topic(query, language.name, topic, results)
+        for language in self.languages:
+            for text, result in self._search_entries.get(language, ()):
+                if query in text:
+                    results.append(dict(result))
 
         return results
 
-    def _search_topic(self, query: str, language: str, topic: Topic, results: List[Dict]):
-        """Recursively search through topics."""
-        query = query.lower()
-
-        # Search in topic title and content
-        if query in topic.title.lower() or query in topic.content.lower():
-            results.append({
-                'language': language,
-                'topic': topic.title,
-                'type': 'topic',
-                'description': topic.description
-            })
-
-        # Search in examples
-        for example in topic.examples:
-            if query in example.title.lower() or query in example.description.lower():
-                results.append({
-                    'language': language,
-                    'topic': topic.title,
-                    'type': 'example',
-                    'description': example.title
-                })
-
-        # Search in exercises
-        for exercise in topic.exercises:
-            if query in exercise.title.lower() or query in exercise.description.lower():
-                results.append({
-                    'language': language,
-                    'topic': topic.title,
-                    'type': 'exercise',
-                    'description': exercise.title
-                })
-
-        # Search in subtopics
-        for subtopic in topic.subtopics:
-            self._search_topic(query, language, subtopic, results)
-
     def get_learning_path(self, language: str) -> List[str]:
         """Get the recommended learning path for a language."""
         language_content = self.get_language_content(language)
@@ -1,16 +1,162 @@
 # utils/enhanced_notifications.py
 
+import collections
+import functools
+import heapq
+import itertools
 import logging
+import threading
+import time
+import weakref
+from pathlib import Path
 from typing import Optional, Union
 from PyQt6.QtWidgets import (
     QWidget, QMessageBox, QLabel, QVBoxLayout, QHBoxLayout,
-    QFrame, QPushButton, QGraphicsOpacityEffect, QApplication
+    QFrame, QPushButton, QApplication
+)
+from PyQt6.QtCore import (
+    Qt, QObject, QTimer, QPropertyAnimation, QParallelAnimationGroup, QEasingCurve, QPointF, QRect, QSize, pyqtSignal
+)
+from PyQt6.QtGui import (
+    QIcon, QPixmap, QPixmapCache, QPainter, QPen, QBrush, QColor, QFont, QFontMetrics
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect, pyqtSignal
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QPen, QBrush, QFont
 
 logger = logging.getLogger('TutorialAgent.Notifications')
 
+# Toast geometry: 20px outer margin, 20/15px frame padding, 1px border,
+# 24px icon and 20px close button separated by 15px spacing
+_TOAST_WIDTH = 400
+_MESSAGE_WIDTH = _TOAST_WIDTH - 2 * 20 - 2 * 20 - 2 * 1 - 24 - 20 - 2 * 15
+_VERTICAL_PADDING = 2 * 20 + 2 * 15 + 2 * 1
+
+_COLORS = {
+    "success": {"bg": "#d4edda", "border": "#c3e6cb", "text": "#155724", "icon": "#28a745"},
+    "error": {"bg": "#f8d7da", "border": "#f5c6cb", "text": "#721c24", "icon": "#dc3545"},
+    "warning": {"bg": "#fff3cd", "border": "#ffeaa7", "text": "#856404", "icon": "#ffc107"},
+    "info": {"bg": "#d1ecf1", "border": "#bee5eb", "text": "#0c5460", "icon": "#17a2b8"}
+}
+
+
+def _build_type_rules(name: str, color_scheme: dict) -> str:
+    """Build the stylesheet rules for one notification type."""
+    return f"""
+        QFrame#notificationFrame[toastType="{name}"] {{
+            background-color: {color_scheme["bg"]};
+            border: 1px solid {color_scheme["border"]};
+        }}
+        QLabel#messageLabel[toastType="{name}"] {{
+            color: {color_scheme["text"]};
+        }}
+    """
+
+
+# One stylesheet serves every toast; the toastType property selects the
+# colors, so changing type re-polishes instead of re-parsing QSS
+_STYLESHEET = """
+        QFrame#notificationFrame {
+            border-radius: 8px;
+        }
+        QLabel#messageLabel {
+            font-size: 14px;
+            font-weight: 500;
+        }
+        QPushButton#closeButton {
+            background: transparent;
+            border: none;
+            border-radius: 10px;
+        }
+        QPushButton#closeButton:hover {
+            background-color: rgba(0, 0, 0, 0.1);
+        }
+""" + "".join(_build_type_rules(name, scheme) for name, scheme in _COLORS.items())
+
+_ICON_DIR = Path(__file__).resolve().parent.parent / 'assets' / 'icons'
+
+_ICON_TEXT = {
+    "success": "✓",
+    "error": "✗",
+    "warning": "⚠",
+    "info": "ℹ"
+}
+
+
+def _animations_enabled() -> bool:
+    """Whether toasts should animate; headless platforms show and hide them directly."""
+    app = QApplication.instance()
+    if app is None:
+        return False
+    return app.platformName() not in ("offscreen", "minimal")
+
+
+@functools.lru_cache(maxsize=1)
+def _icon_font() -> QFont:
+    """Font for icon glyphs, created on first use once Qt is running."""
+    font = QFont()
+    font.setPixelSize(14)
+    font.setBold(True)
+    return font
+
+
+@functools.lru_cache(maxsize=None)
+def _close_icon(color: str) -> QIcon:
+    """Close-button cross in the given color, drawn once per color."""
+    icon = QIcon()
+    for dpr in (1.0, 2.0):
+        pixmap = QPixmap(round(12 * dpr), round(12 * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen(QColor(color), 1.8)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        painter.drawLine(QPointF(2, 2), QPointF(10, 10))
+        painter.drawLine(QPointF(10, 2), QPointF(2, 10))
+        painter.end()
+
+        icon.addPixmap(pixmap)
+    return icon
+
+
+def _make_icon_pixmap(notification_type: str, dpr: float) -> QPixmap:
+    """Render the 24x24 icon for a notification type from its SVG asset."""
+    if notification_type not in _ICON_TEXT:
+        notification_type = "info"
+
+    pixmap = QIcon(str(_ICON_DIR / f"toast_{notification_type}.svg")).pixmap(QSize(24, 24), dpr)
+    if not pixmap.isNull():
+        return pixmap
+
+    # Asset missing or no SVG support: draw the glyph instead
+    return _paint_icon_pixmap(notification_type, dpr)
+
+
+def _paint_icon_pixmap(notification_type: str, dpr: float) -> QPixmap:
+    """Paint the 24x24 icon for a notification type."""
+    icon_text = _ICON_TEXT.get(notification_type, "ℹ")
+
+    # Create icon pixmap at device resolution, drawn in logical coordinates
+    pixmap = QPixmap(round(24 * dpr), round(24 * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # Draw circle background
+    painter.setBrush(QBrush(Qt.GlobalColor.white))
+    painter.setPen(QPen(Qt.GlobalColor.white, 2))
+    painter.drawEllipse(2, 2, 20, 20)
+
+    # Draw icon text
+    painter.setFont(_icon_font())
+    painter.setPen(QPen(Qt.GlobalColor.black))
+    painter.drawText(QRect(0, 0, 24, 24), Qt.AlignmentFlag.AlignCenter, icon_text)
+
+    painter.end()
+    return pixmap
+
 
 class ToastNotification(QWidget):
     """Modern toast notification widget with animations."""
@@ -21,6 +167,7 @@ class ToastNotification(QWidget):
         super().__init__(parent)
         self.notification_type = notification_type
         self.duration = duration
+        self._styled_type = None
 
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint |
@@ -33,6 +180,18 @@ class ToastNotification(QWidget):
         self.setup_ui(message)
         self.setup_animations()
 
+    def reconfigure(self, message: str, notification_type: str, duration: int, parent=None):
+        """Prepare a pooled notification to show a new message."""
+        if parent is not self.parentWidget():
+            # Keep the frameless tool-window flags when moving to a new parent
+            self.setParent(parent, self.windowFlags())
+
+        self.notification_type = notification_type
+        self.duration = duration
+        self.message_label.setText(message)
+        self.apply_styles()
+        self._fit_height()
+
     def setup_ui(self, message: str):
         """Setup the notification UI."""
         # Main layout
@@ -62,113 +221,85 @@ class ToastNotification(QWidget):
         frame_layout.addWidget(self.message_label, 1)
 
         # Close button
-        self.close_button = QPushButton("×")
+        self.close_button = QPushButton()
         self.close_button.setFixedSize(20, 20)
+        self.close_button.setIconSize(QSize(12, 12))
+        self.close_button.setAccessibleName("Close")
         self.close_button.setObjectName("closeButton")
         self.close_button.clicked.connect(self.hide_notification)
         frame_layout.addWidget(self.close_button)
 
         # Apply styles
+        self.setStyleSheet(_STYLESHEET)
         self.apply_styles()
 
-        # Set fixed width and auto height
-        self.setFixedWidth(400)
-        self.adjustSize()
+        # Set fixed width and a height that fits the message
+        self._fit_height()
+
+    def _fit_height(self):
+        """Size the toast to its message from font metrics, without a layout pass."""
+        # Styles set the label font, so make sure they have been applied
+        self.message_label.ensurePolished()
+        text_height = QFontMetrics(self.message_label.font()).boundingRect(
+            0, 0, _MESSAGE_WIDTH, 10000, Qt.TextFlag.TextWordWrap, self.message_label.text()
+        ).height()
+        self.setFixedSize(_TOAST_WIDTH, max(text_height, 24) + _VERTICAL_PADDING)
 
     def apply_styles(self):
         """Apply styles based on notification type."""
-        colors = {
-            "success": {"bg": "#d4edda", "border": "#c3e6cb", "text": "#155724", "icon": "#28a745"},
-            "error": {"bg": "#f8d7da", "border": "#f5c6cb", "text": "#721c24", "icon": "#dc3545"},
-            "warning": {"bg": "#fff3cd", "border": "#ffeaa7", "text": "#856404", "icon": "#ffc107"},
-            "info": {"bg": "#d1ecf1", "border": "#bee5eb", "text": "#0c5460", "icon": "#17a2b8"}
-        }
-
-        color_scheme = colors.get(self.notification_type, colors["info"])
-
-        self.setStyleSheet(f"""
-            QFrame#notificationFrame {{
-                background-color: {color_scheme["bg"]};
-                border: 1px solid {color_scheme["border"]};
-                border-radius: 8px;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-            }}
-            QLabel#messageLabel {{
-                color: {color_scheme["text"]};
-                font-size: 14px;
-                font-weight: 500;
-            }}
-            QPushButton#closeButton {{
-                background: transparent;
-                border: none;
-                color: {color_scheme["text"]};
-                font-size: 16px;
-                font-weight: bold;
-                border-radius: 10px;
-            }}
-            QPushButton#closeButton:hover {{
-                background-color: rgba(0, 0, 0, 0.1);
-            }}
-        """)
+        color_scheme = _COLORS.get(self.notification_type, _COLORS["info"])
+
+        # Re-polishing is expensive; pooled toasts often keep their type
+        if self._styled_type != self.notification_type:
+            toast_type = self.notification_type if self.notification_type in _COLORS else "info"
+            for widget in (self.frame, self.message_label):
+                widget.setProperty("toastType", toast_type)
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
+            self.close_button.setIcon(_close_icon(color_scheme["text"]))
+            self._styled_type = self.notification_type
 
         # Set icon
-        self.set_icon(color_scheme["icon"])
+        self.set_icon()
 
-    def set_icon(self, color: str):
+    def set_icon(self):
         """Set notification icon based on type."""
-        icons = {
-            "success": "✓",
-            "error": "✗",
-            "warning": "⚠",
-            "info": "ℹ"
-        }
-
-        icon_text = icons.get(self.notification_type, "ℹ")
-
-        # Create icon pixmap
-        pixmap = QPixmap(24, 24)
-        pixmap.fill(Qt.GlobalColor.transparent)
-
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw circle background
-        painter.setBrush(QBrush(Qt.GlobalColor.white))
-        painter.setPen(QPen(Qt.GlobalColor.white, 2))
-        painter.drawEllipse(2, 2, 20, 20)
-
-        # Draw icon text
-        font = QFont()
-        font.setPixelSize(14)
-        font.setBold(True)
-        painter.setFont(font)
-        painter.setPen(QPen(Qt.GlobalColor.black))
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, icon_text)
-
-        painter.end()
+        # Painted icons live in Qt's shared, size-bounded pixmap cache
+        dpr = self.devicePixelRatioF()
+        key = f"toast_icon_{self.notification_type}_{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = _make_icon_pixmap(self.notification_type, dpr)
+            QPixmapCache.insert(key, pixmap)
 
         self.icon_label.setPixmap(pixmap)
 
     def setup_animations(self):
         """Setup entrance and exit animations."""
-        # Opacity effect
-        self.opacity_effect = QGraphicsOpacityEffect()
-        self.setGraphicsEffect(self.opacity_effect)
+        self.animated = _animations_enabled()
+        if not self.animated:
+            return
 
         # Slide in animation
         self.slide_animation = QPropertyAnimation(self, b"geometry")
         self.slide_animation.setDuration(300)
         self.slide_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        # Fade in animation
-        self.fade_in_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        # Fade in animation; the toast is a top-level window, so fading its
+        # window opacity avoids rendering through an offscreen effect
+        self.fade_in_animation = QPropertyAnimation(self, b"windowOpacity")
         self.fade_in_animation.setDuration(300)
         self.fade_in_animation.setStartValue(0.0)
         self.fade_in_animation.setEndValue(1.0)
         self.fade_in_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
 
+        # Slide and fade in run together, driven by one group
+        self.enter_animation = QParallelAnimationGroup(self)
+        self.enter_animation.addAnimation(self.slide_animation)
+        self.enter_animation.addAnimation(self.fade_in_animation)
+
         # Fade out animation
-        self.fade_out_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        self.fade_out_animation = QPropertyAnimation(self, b"windowOpacity")
         self.fade_out_animation.setDuration(200)
         self.fade_out_animation.setStartValue(1.0)
         self.fade_out_animation.setEndValue(0.0)
@@ -176,13 +307,7 @@ class ToastNotification(QWidget):
         self.fade_out_animation.finished.connect(self.close)
         self.fade_out_animation.finished.connect(self.closed.emit)
 
-        # Auto-hide timer
-        if self.duration > 0:
-            self.hide_timer = QTimer()
-            self.hide_timer.setSingleShot(True)
-            self.hide_timer.timeout.connect(self.hide_notification)
-
-    def show_notification(self, parent_widget=None):
+    def show_notification(self, parent_widget=None, screen_geometry: Optional[QRect] = None):
         """Show the notification with animation."""
         # Position the notification
         if parent_widget:
@@ -194,7 +319,9 @@ class ToastNotification(QWidget):
             y = parent_global.y() + 20
         else:
             # Position at screen top-right
-            screen = QApplication.primaryScreen().geometry()
+            screen = screen_geometry
+            if screen is None:
+                screen = QApplication.primaryScreen().geometry()
             x = screen.width() - self.width() - 20
             y = 20
 
@@ -202,23 +329,27 @@ class ToastNotification(QWidget):
         start_rect = QRect(x + self.width(), y, self.width(), self.height())
         end_rect = QRect(x, y, self.width(), self.height())
 
+        if not self.animated:
+            self.setGeometry(end_rect)
+            self.setWindowOpacity(1.0)
+            self.show()
+            return
+
         self.setGeometry(start_rect)
+        self.setWindowOpacity(0.0)
         self.show()
 
         # Start animations
         self.slide_animation.setStartValue(start_rect)
         self.slide_animation.setEndValue(end_rect)
-        self.slide_animation.start()
-        self.fade_in_animation.start()
-
-        # Start auto-hide timer
-        if hasattr(self, 'hide_timer'):
-            self.hide_timer.start(self.duration)
+        self.enter_animation.start()
 
     def hide_notification(self):
         """Hide the notification with animation."""
-        if hasattr(self, 'hide_timer'):
-            self.hide_timer.stop()
+        if not self.animated:
+            self.close()
+            self.closed.emit()
+            return
         self.fade_out_animation.start()
 
     def mousePressEvent(self, event):
@@ -230,42 +361,161 @@ class ToastNotification(QWidget):
 class NotificationManager:
     """Manages multiple notifications and positioning."""
 
-    def __init__(self):
+    def __init__(self, pool_size: int = 8):
         self.notifications = []
         self.spacing = 10
 
+        # Closed notifications kept for reuse instead of being rebuilt
+        self._pool = []
+        self._pool_size = pool_size
+
+        # Progress notification updated in place by show_or_update_progress
+        self._progress_notification = None
+        self._progress_message = None
+        self._progress_format = None
+
+        # Primary screen geometry, refreshed when the screen changes
+        self._screen = None
+        self._screen_geom = None
+
+        # Repositioning after closes is coalesced into one animation group
+        self._reposition_pending = False
+        self._reposition_group = None
+
+        # One coarse timer drives auto-hide for every notification; deadlines
+        # are a heap of (monotonic ms, sequence, weakref to notification)
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._expiry_timer = QTimer()
+        self._expiry_timer.setInterval(100)
+        self._expiry_timer.timeout.connect(self._expire_notifications)
+
     def show_notification(self, message: str, notification_type: str = "info",
                           duration: int = 3000, parent=None):
         """Show a new notification."""
-        # Create notification
-        notification = ToastNotification(message, notification_type, duration, parent)
-        notification.closed.connect(lambda: self._remove_notification(notification))
+        # The caller may keep the returned toast (e.g. to hide it later), so
+        # it is never recycled for another message once it closes
+        return self._show(message, notification_type, duration, parent, recycle=False)
+
+    def _show_transient(self, message: str, notification_type: str = "info",
+                        duration: int = 3000, parent=None):
+        """Show a notification no caller holds on to; it is pooled after closing."""
+        self._show(message, notification_type, duration, parent, recycle=True)
+
+    def _show(self, message: str, notification_type: str, duration: int, parent, recycle: bool):
+        """Show a notification, marking whether it may be pooled once closed."""
+        # Reuse a pooled notification, or create one
+        if self._pool:
+            notification = self._pool.pop()
+            notification.reconfigure(message, notification_type, duration, parent)
+        else:
+            notification = ToastNotification(message, notification_type, duration, parent)
+            notification.closed.connect(lambda: self._remove_notification(notification))
+        notification._recyclable = recycle
 
         # Add to list
         self.notifications.append(notification)
 
         # Position and show
         self._position_notifications(parent)
-        notification.show_notification(parent)
+        notification.show_notification(parent, None if parent else self._screen_geometry())
+
+        # Schedule auto-hide (0 duration = persistent)
+        self._schedule_hide(notification, duration)
 
         return notification
 
+    def show_or_update_progress(self, message: str, progress: int, parent=None,
+                                duration: int = 2000):
+        """Show a progress notification, updating the visible one in place."""
+        if message != self._progress_message:
+            self._progress_message = message
+            self._progress_format = message.replace("{", "{{").replace("}", "}}") + " ({}%)"
+        progress_message = self._progress_format.format(progress)
+
+        # Cleared when the toast closes, so a pooled toast reused for another
+        # message is never mistaken for the progress one
+        notification = self._progress_notification
+        if notification is None:
+            self._progress_notification = self.show_notification(progress_message, "info", duration, parent)
+            return self._progress_notification
+
+        notification.message_label.setText(progress_message)
+        notification._fit_height()
+        self._schedule_hide(notification, duration)
+        return notification
+
+    def _schedule_hide(self, notification, duration: int):
+        """Hide a notification after duration ms, replacing any earlier deadline."""
+        # Deadlines are tagged with an id so a notification that is reused or
+        # rescheduled ignores the ones it had before
+        notification._deadline_id = next(self._sequence)
+        if duration > 0:
+            deadline = time.monotonic() * 1000 + duration
+            heapq.heappush(self._deadlines, (deadline, notification._deadline_id, weakref.ref(notification)))
+            if not self._expiry_timer.isActive():
+                self._expiry_timer.start()
+
+    def _expire_notifications(self):
+        """Hide notifications whose display time has run out."""
+        now = time.monotonic() * 1000
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, deadline_id, notification_ref = heapq.heappop(self._deadlines)
+            notification = notification_ref()
+            if (notification is not None and notification in self.notifications
+                    and notification._deadline_id == deadline_id):
+                notification.hide_notification()
+
+        if not self._deadlines:
+            self._expiry_timer.stop()
+
     def _remove_notification(self, notification):
         """Remove notification from list and reposition others."""
+        if notification is self._progress_notification:
+            self._progress_notification = None
+
         if notification in self.notifications:
             self.notifications.remove(notification)
             self._reposition_notifications()
 
+            if not notification._recyclable:
+                # A caller holds this toast; deleting it would break their handle
+                return
+
+            if len(self._pool) < self._pool_size:
+                # Detach so the pooled toast does not die with its old parent
+                notification.setParent(None, notification.windowFlags())
+                self._pool.append(notification)
+            else:
+                notification.deleteLater()
+
+    def _screen_geometry(self) -> QRect:
+        """Return the cached primary screen geometry."""
+        if self._screen_geom is None:
+            app = QApplication.instance()
+            screen = app.primaryScreen()
+            if self._screen is None:
+                app.primaryScreenChanged.connect(self._on_screen_changed)
+            if screen is not self._screen:
+                screen.geometryChanged.connect(self._on_screen_changed)
+                self._screen = screen
+            self._screen_geom = screen.geometry()
+        return self._screen_geom
+
+    def _on_screen_changed(self, *args):
+        """Drop the cached screen geometry so it is read again."""
+        self._screen_geom = None
+
     def _position_notifications(self, parent_widget=None):
         """Position all notifications."""
         if parent_widget:
             parent_rect = parent_widget.rect()
             parent_global = parent_widget.mapToGlobal(parent_rect.topRight())
-            base_x = parent_global.x() - 400 - 20  # notification width + margin
+            base_x = parent_global.x() - _TOAST_WIDTH - 20  # notification width + margin
             base_y = parent_global.y() + 20
         else:
-            screen = QApplication.primaryScreen().geometry()
-            base_x = screen.width() - 400 - 20
+            screen = self._screen_geometry()
+            base_x = screen.width() - _TOAST_WIDTH - 20
             base_y = 20
 
         for i, notification in enumerate(self.notifications):
@@ -273,21 +523,39 @@ class NotificationManager:
             notification.move(base_x, base_y + y_offset)
 
     def _reposition_notifications(self):
-        """Reposition remaining notifications."""
+        """Reposition remaining notifications on the next event-loop pass."""
+        if not self._reposition_pending:
+            self._reposition_pending = True
+            QTimer.singleShot(0, self._do_reposition)
+
+    def _do_reposition(self):
+        """Animate remaining notifications into their stacked positions."""
+        self._reposition_pending = False
+        if self._reposition_group is not None:
+            self._reposition_group.stop()
+
+        animated = _animations_enabled()
+        group = QParallelAnimationGroup()
         for i, notification in enumerate(self.notifications):
             current_rect = notification.geometry()
             new_y = 20 + i * (current_rect.height() + self.spacing)
 
+            if not animated:
+                notification.move(current_rect.x(), new_y)
+                continue
+
             # Animate to new position
             animation = QPropertyAnimation(notification, b"geometry")
             animation.setDuration(200)
             animation.setStartValue(current_rect)
             animation.setEndValue(QRect(current_rect.x(), new_y, current_rect.width(), current_rect.height()))
             animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-            animation.start()
+            group.addAnimation(animation)
+
+        group.start()
 
-            # Keep reference to prevent garbage collection
-            notification._reposition_animation = animation
+        # Keep reference to prevent garbage collection
+        self._reposition_group = group
 
     def clear_all(self):
         """Clear all notifications."""
@@ -295,15 +563,23 @@ class NotificationManager:
             notification.hide_notification()
 
 
-# Global notification manager
-_notification_manager = NotificationManager()
+# Global notification manager, created on first use
+_notification_manager: Optional[NotificationManager] = None
+
+
+def _get_manager() -> NotificationManager:
+    """Return the global notification manager, creating it if needed."""
+    global _notification_manager
+    if _notification_manager is None:
+        _notification_manager = NotificationManager()
+    return _notification_manager
 
 
 def show_success(message: str, parent: Optional[QWidget] = None, duration: int = 3000) -> None:
     """Show a success notification."""
     try:
-        logger.info(f"Success notification: {message}")
-        _notification_manager.show_notification(message, "success", duration, parent)
+        logger.info("Success notification: %s", message)
+        _get_manager()._show_transient(message, "success", duration, parent)
     except Exception as e:
         logger.error(f"Error showing success notification: {e}")
         # Fallback to message box
@@ -313,8 +589,8 @@ def show_success(message: str, parent: Optional[QWidget] = None, duration: int =
 def show_error(message: str, parent: Optional[QWidget] = None, duration: int = 5000) -> None:
     """Show an error notification."""
     try:
-        logger.error(f"Error notification: {message}")
-        _notification_manager.show_notification(message, "error", duration, parent)
+        logger.error("Error notification: %s", message)
+        _get_manager()._show_transient(message, "error", duration, parent)
     except Exception as e:
         logger.error(f"Error showing error notification: {e}")
         # Fallback to message box
@@ -324,8 +600,8 @@ def show_error(message: str, parent: Optional[QWidget] = None, duration: int = 5
 def show_warning(message: str, parent: Optional[QWidget] = None, duration: int = 4000) -> None:
     """Show a warning notification."""
     try:
-        logger.warning(f"Warning notification: {message}")
-        _notification_manager.show_notification(message, "warning", duration, parent)
+        logger.warning("Warning notification: %s", message)
+        _get_manager()._show_transient(message, "warning", duration, parent)
     except Exception as e:
         logger.error(f"Error showing warning notification: {e}")
         # Fallback to message box
@@ -335,8 +611,8 @@ def show_warning(message: str, parent: Optional[QWidget] = None, duration: int =
 def show_info(message: str, parent: Optional[QWidget] = None, duration: int = 3000) -> None:
     """Show an info notification."""
     try:
-        logger.info(f"Info notification: {message}")
-        _notification_manager.show_notification(message, "info", duration, parent)
+        logger.info("Info notification: %s", message)
+        _get_manager()._show_transient(message, "info", duration, parent)
     except Exception as e:
         logger.error(f"Error showing info notification: {e}")
         # Fallback to message box
@@ -356,10 +632,71 @@ def _show_fallback_message(title: str, message: str, icon: QMessageBox.Icon, par
         logger.critical(f"Error showing fallback message: {e}")
 
 
+class _NotificationQueue(QObject):
+    """Collects notifications posted from any thread and shows them on the GUI thread."""
+
+    _posted = pyqtSignal()
+
+    def __init__(self, max_burst: int = 3):
+        super().__init__()
+        self.max_burst = max_burst
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._drain_scheduled = False
+
+        # Deliver to the GUI thread whichever thread created the queue
+        self.moveToThread(QApplication.instance().thread())
+        self._posted.connect(self._drain, Qt.ConnectionType.QueuedConnection)
+
+    def post(self, message: str, notification_type: str, duration: int):
+        """Queue a notification without waiting for it to be shown."""
+        with self._lock:
+            self._pending.append((message, notification_type, duration))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self._posted.emit()
+
+    def _drain(self):
+        """Show everything queued since the last drain, collapsing bursts."""
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            self._drain_scheduled = False
+
+        manager = _get_manager()
+        for message, notification_type, duration in pending[:self.max_burst]:
+            manager._show_transient(message, notification_type, duration)
+
+        hidden = len(pending) - self.max_burst
+        if hidden > 0:
+            manager._show_transient(f"(+{hidden} more notifications)", "info", 3000)
+
+
+_notification_queue: Optional[_NotificationQueue] = None
+_notification_queue_lock = threading.Lock()
+
+
+def post_notification(message: str, notification_type: str = "info", duration: int = 3000) -> None:
+    """Queue a notification from any thread; it is shown on the GUI thread.
+
+    Producers never block on widget creation, and bursts posted between two
+    event-loop passes are collapsed into a few toasts plus a "+N more" toast.
+    """
+    global _notification_queue
+    try:
+        with _notification_queue_lock:
+            if _notification_queue is None:
+                _notification_queue = _NotificationQueue()
+        _notification_queue.post(message, notification_type, duration)
+    except Exception as e:
+        logger.error(f"Error posting notification: {e}")
+
+
 def clear_all_notifications() -> None:
     """Clear all active notifications."""
     try:
-        _notification_manager.clear_all()
+        _get_manager().clear_all()
     except Exception as e:
         logger.error(f"Error clearing notifications: {e}")
 
@@ -368,13 +705,15 @@ def clear_all_notifications() -> None:
 
 def show_loading(message: str = "Loading...", parent: Optional[QWidget] = None) -> ToastNotification:
     """Show a persistent loading notification."""
-    return _notification_manager.show_notification(message, "info", 0, parent)  # 0 duration = persistent
+    return _get_manager().show_notification(message, "info", 0, parent)  # 0 duration = persistent
 
 
 def show_progress(message: str, progress: int, parent: Optional[QWidget] = None) -> None:
     """Show a progress notification."""
-    progress_message = f"{message} ({progress}%)"
-    show_info(progress_message, parent, 2000)
+    try:
+        _get_manager().show_or_update_progress(message, progress, parent)
+    except Exception as e:
+        logger.error(f"Error showing progress notification: {e}")
 
 
 def show_confirmation(message: str, parent: Optional[QWidget] = None) -> bool:
@@ -397,7 +736,7 @@ def show_custom(title: str, message: str, icon_type: str = "info",
                 parent: Optional[QWidget] = None, duration: int = 3000) -> None:
     """Show a custom notification with specified parameters."""
     try:
-        _notification_manager.show_notification(message, icon_type, duration, parent)
+        _get_manager()._show_transient(message, icon_type, duration, parent)
     except Exception as e:
         logger.error(f"Error showing custom notification: {e}")
         # Fallback
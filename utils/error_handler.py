@@ -3,8 +3,9 @@
 import logging
 import traceback
 import sys
-from typing import Optional, Callable, Any, Dict
-from functools import wraps
+import time
+from typing import Optional, Callable, Any, Dict, Union
+from functools import partial, wraps
 from datetime import datetime
 from pathlib import Path
 
@@ -13,7 +14,7 @@ from PyQt6.QtWidgets import (
     QPushButton, QLabel, QApplication, QWidget, QFrame,
     QProgressBar, QSystemTrayIcon
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QPropertyAnimation, QRect
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot, QObject, QPropertyAnimation, QAbstractAnimation, QRect
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QFont, QColor
 
 logger = logging.getLogger('TutorialAgent.ErrorHandler')
@@ -30,13 +31,59 @@ class NotificationLevel:
 class ToastNotification(QFrame):
     """Toast notification widget for non-intrusive user feedback."""
 
+    # Stylesheets are shared by every toast, so they are built once here
+    _BACKGROUNDS = {
+        NotificationLevel.INFO: 'rgba(52, 152, 219, 0.9)',
+        NotificationLevel.SUCCESS: 'rgba(46, 204, 113, 0.9)',
+        NotificationLevel.WARNING: 'rgba(241, 196, 15, 0.9)',
+        NotificationLevel.ERROR: 'rgba(231, 76, 60, 0.9)'
+    }
+    _ICONS = {
+        NotificationLevel.INFO: '🛈',
+        NotificationLevel.SUCCESS: '✓',
+        NotificationLevel.WARNING: '⚠',
+        NotificationLevel.ERROR: '✗'
+    }
+    _FRAME_QSS = {
+        level: f"""
+            QFrame {{
+                background: {background};
+                border-radius: 8px;
+                border: 1px solid rgba(255, 255, 255, 0.3);
+            }}
+        """
+        for level, background in _BACKGROUNDS.items()
+    }
+    _ICON_QSS = """
+        QLabel {
+            color: white;
+            font-size: 20px;
+            font-weight: bold;
+            text-align: center;
+        }
+    """
+    _MESSAGE_QSS = "color: white; font-size: 12px;"
+    _CLOSE_BTN_QSS = """
+        QPushButton {
+            background: transparent;
+            color: white;
+            border: none;
+            font-size: 16px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background: rgba(255, 255, 255, 0.2);
+            border-radius: 10px;
+        }
+    """
+
     def __init__(self, message: str, level: str = NotificationLevel.INFO, duration: int = 3000):
         super().__init__()
         self.level = level
         self.duration = duration
+        self._hiding = False
         self.setup_ui()
         self.set_message(message)
-        self.setup_animation()
 
     def setup_ui(self):
         """Setup the notification UI."""
@@ -55,30 +102,19 @@ class ToastNotification(QFrame):
         # Icon label
         self.icon_label = QLabel()
         self.icon_label.setFixedSize(32, 32)
+        self.icon_label.setStyleSheet(self._ICON_QSS)
         layout.addWidget(self.icon_label)
 
         # Message label
         self.message_label = QLabel()
         self.message_label.setWordWrap(True)
-        self.message_label.setStyleSheet("color: white; font-size: 12px;")
+        self.message_label.setStyleSheet(self._MESSAGE_QSS)
         layout.addWidget(self.message_label, 1)
 
         # Close button
         close_button = QPushButton("×")
         close_button.setFixedSize(20, 20)
-        close_button.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: white;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.2);
-                border-radius: 10px;
-            }
-        """)
+        close_button.setStyleSheet(self._CLOSE_BTN_QSS)
         close_button.clicked.connect(self.hide_notification)
         layout.addWidget(close_button)
 
@@ -87,58 +123,20 @@ class ToastNotification(QFrame):
 
     def update_style(self):
         """Update styling based on notification level."""
-        styles = {
-            NotificationLevel.INFO: {
-                'background': 'rgba(52, 152, 219, 0.9)',
-                'icon': '🛈'
-            },
-            NotificationLevel.SUCCESS: {
-                'background': 'rgba(46, 204, 113, 0.9)',
-                'icon': '✓'
-            },
-            NotificationLevel.WARNING: {
-                'background': 'rgba(241, 196, 15, 0.9)',
-                'icon': '⚠'
-            },
-            NotificationLevel.ERROR: {
-                'background': 'rgba(231, 76, 60, 0.9)',
-                'icon': '✗'
-            }
-        }
-
-        style_info = styles.get(self.level, styles[NotificationLevel.INFO])
-
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {style_info['background']};
-                border-radius: 8px;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }}
-        """)
-
-        self.icon_label.setText(style_info['icon'])
-        self.icon_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 20px;
-                font-weight: bold;
-                text-align: center;
-            }
-        """)
+        level = self.level if self.level in self._FRAME_QSS else NotificationLevel.INFO
+        self.setStyleSheet(self._FRAME_QSS[level])
+        self.icon_label.setText(self._ICONS[level])
 
     def set_message(self, message: str):
         """Set the notification message."""
         self.message_label.setText(message)
 
-    def setup_animation(self):
-        """Setup slide-in animation."""
-        self.animation = QPropertyAnimation(self, b"geometry")
-        self.animation.setDuration(300)
-
-        # Timer for auto-hide
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.hide_notification)
-        self.timer.setSingleShot(True)
+    def reset(self, message: str, duration: int = 3000):
+        """Prepare a pooled notification to be shown again."""
+        NotificationManager._cancel_hide(self)
+        self._hiding = False
+        self.duration = duration
+        self.set_message(message)
 
     def show_notification(self, parent_widget: QWidget = None):
         """Show the notification with animation."""
@@ -149,9 +147,9 @@ class ToastNotification(QFrame):
             y = parent_rect.top() + 20
         else:
             # Use screen geometry
-            screen = QApplication.primaryScreen().geometry()
-            x = screen.right() - self.width() - 20
-            y = screen.top() + 20
+            screen_right, screen_top = NotificationManager._screen_corner()
+            x = screen_right - self.width() - 20
+            y = screen_top + 20
 
         # Start position (off-screen)
         start_rect = QRect(x + self.width(), y, self.width(), self.height())
@@ -161,16 +159,20 @@ class ToastNotification(QFrame):
         self.show()
 
         # Animate slide-in
-        self.animation.setStartValue(start_rect)
-        self.animation.setEndValue(end_rect)
-        self.animation.start()
+        NotificationManager._animate(self, start_rect, end_rect)
 
         # Start auto-hide timer
         if self.duration > 0:
-            self.timer.start(self.duration)
+            NotificationManager._schedule_hide(self, self.duration)
 
+    @pyqtSlot()
     def hide_notification(self):
         """Hide the notification with animation."""
+        if self._hiding or not self.isVisible():
+            return
+        self._hiding = True
+        NotificationManager._cancel_hide(self)
+
         current_rect = self.geometry()
         end_rect = QRect(
             current_rect.right(),
@@ -179,22 +181,68 @@ class ToastNotification(QFrame):
             current_rect.height()
         )
 
-        self.animation.setStartValue(current_rect)
-        self.animation.setEndValue(end_rect)
-        self.animation.finished.connect(self.close)
-        self.animation.start()
+        NotificationManager._animate(self, current_rect, end_rect, self._on_animation_finished)
+
+    def _on_animation_finished(self):
+        """Hand the notification back to the manager once it has slid out."""
+        if self._hiding:
+            self.hide()
+            NotificationManager._cleanup_notification(self)
 
 
 class ErrorDialog(QDialog):
     """Enhanced error dialog with details and reporting options."""
 
-    def __init__(self, title: str, message: str, details: str = None, parent=None):
+    # One sheet for the whole dialog, so Qt parses a single stylesheet per dialog
+    _STYLESHEET = """
+        QDialog {
+            background-color: white;
+        }
+        QLabel#errorMessage {
+            font-size: 14px;
+            padding: 10px;
+            background: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 4px;
+        }
+        QTextEdit#errorDetails {
+            background: #2d2d30;
+            color: #d4d4d4;
+            font-family: 'Consolas', 'Courier New', monospace;
+            font-size: 10pt;
+            border: 1px solid #3e3e3e;
+        }
+        QPushButton {
+            background-color: #007bff;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 16px;
+            font-size: 12px;
+        }
+        QPushButton:hover {
+            background-color: #0056b3;
+        }
+        QPushButton:pressed {
+            background-color: #004085;
+        }
+    """
+
+    def __init__(self, title: str, message: str,
+                 details: Union[str, Callable[[], str]] = None, parent=None):
         super().__init__(parent)
         self.title = title
         self.message = message
-        self.details = details
+        self._details = details
         self.setup_ui()
 
+    @property
+    def details(self) -> Optional[str]:
+        """Error details; a deferred traceback is formatted on first access."""
+        if callable(self._details):
+            self._details = self._details()
+        return self._details
+
     def setup_ui(self):
         """Setup the error dialog UI."""
         self.setWindowTitle(self.title)
@@ -205,37 +253,21 @@ class ErrorDialog(QDialog):
 
         # Message
         message_label = QLabel(self.message)
+        message_label.setObjectName("errorMessage")
         message_label.setWordWrap(True)
-        message_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                padding: 10px;
-                background: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-            }
-        """)
         layout.addWidget(message_label)
 
         # Details (collapsible)
-        if self.details:
+        if self._details:
             self.details_button = QPushButton("Show Details")
             self.details_button.clicked.connect(self.toggle_details)
             layout.addWidget(self.details_button)
 
+            # Filled in on first "Show Details" so the traceback is only formatted if viewed
             self.details_text = QTextEdit()
-            self.details_text.setPlainText(self.details)
+            self.details_text.setObjectName("errorDetails")
             self.details_text.setVisible(False)
             self.details_text.setMaximumHeight(150)
-            self.details_text.setStyleSheet("""
-                QTextEdit {
-                    background: #2d2d30;
-                    color: #d4d4d4;
-                    font-family: 'Consolas', 'Courier New', monospace;
-                    font-size: 10pt;
-                    border: 1px solid #3e3e3e;
-                }
-            """)
             layout.addWidget(self.details_text)
 
         # Buttons
@@ -255,25 +287,7 @@ class ErrorDialog(QDialog):
         layout.addLayout(button_layout)
 
         # Styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-            }
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
 
     def toggle_details(self):
         """Toggle the visibility of error details."""
@@ -281,6 +295,8 @@ class ErrorDialog(QDialog):
             self.details_text.setVisible(False)
             self.details_button.setText("Show Details")
         else:
+            if self.details_text.document().isEmpty():
+                self.details_text.setPlainText(self.details)
             self.details_text.setVisible(True)
             self.details_button.setText("Hide Details")
 
@@ -311,6 +327,28 @@ class NotificationManager:
 
     _instance = None
     _notifications = []
+    _pool: Dict[str, list] = {}
+    _POOL_SIZE = 4
+
+    # Repeats of the visible toast are folded into it rather than stacked
+    _last_toast = None
+    _last_message = None
+    _last_count = 0
+    _last_shown_at = 0.0
+
+    # One geometry animation shared by all toasts
+    _anim = None
+    _anim_on_finished = None
+
+    # Auto-hide deadlines (time.monotonic()) swept by one shared timer
+    _hide_deadlines: Dict[ToastNotification, float] = {}
+    _sweeper = None
+
+    # Top-right corner of the primary screen, dropped when the screen changes
+    _screen_right = None
+    _screen_top = None
+    _hooked_screen = None
+    _app_hooked = False
 
     @classmethod
     def get_instance(cls):
@@ -322,24 +360,134 @@ class NotificationManager:
     def show_toast(cls, message: str, level: str = NotificationLevel.INFO,
                    duration: int = 3000, parent: QWidget = None):
         """Show a toast notification."""
-        notification = ToastNotification(message, level, duration)
+        now = time.monotonic()
+        last = cls._last_toast
+        if (last is not None and last in cls._notifications and not last._hiding
+                and last.level == level and cls._last_message == message):
+            cls._last_count += 1
+            last.set_message(f"{message} (×{cls._last_count})")
+
+            # Extend only within 2 * duration so one toast stays up at most 3 * duration
+            if duration > 0 and (now - cls._last_shown_at) * 1000 < 2 * duration:
+                cls._schedule_hide(last, duration)
+            return
+
+        pool = cls._pool.get(level)
+        if pool:
+            notification = pool.pop()
+            notification.reset(message, duration)
+        else:
+            notification = ToastNotification(message, level, duration)
         notification.show_notification(parent)
 
         # Keep reference to prevent garbage collection
         cls._notifications.append(notification)
 
-        # Clean up after duration + animation time
-        QTimer.singleShot(duration + 500, lambda: cls._cleanup_notification(notification))
+        cls._last_toast = notification
+        cls._last_message = message
+        cls._last_count = 1
+        cls._last_shown_at = now
+
+    @classmethod
+    def _schedule_hide(cls, notification, duration: int):
+        """Hide a notification after duration ms, replacing any earlier deadline."""
+        cls._hide_deadlines[notification] = time.monotonic() + duration / 1000
+
+        if cls._sweeper is None:
+            cls._sweeper = QTimer()
+            cls._sweeper.setInterval(100)
+            cls._sweeper.timeout.connect(cls._sweep_notifications)
+        if not cls._sweeper.isActive():
+            cls._sweeper.start()
+
+    @classmethod
+    def _cancel_hide(cls, notification):
+        """Drop a notification's pending auto-hide."""
+        cls._hide_deadlines.pop(notification, None)
+
+    @classmethod
+    def _sweep_notifications(cls):
+        """Hide every notification whose deadline has passed."""
+        now = time.monotonic()
+        expired = [n for n, deadline in cls._hide_deadlines.items() if deadline <= now]
+        for notification in expired:
+            del cls._hide_deadlines[notification]
+            notification.hide_notification()
+
+        if not cls._hide_deadlines:
+            cls._sweeper.stop()
+
+    @classmethod
+    def _screen_corner(cls):
+        """Return the cached (right, top) of the primary screen."""
+        if cls._screen_right is None:
+            app = QApplication.instance()
+            screen = app.primaryScreen()
+            geometry = screen.geometry()
+            cls._screen_right, cls._screen_top = geometry.right(), geometry.top()
+
+            if not cls._app_hooked:
+                app.primaryScreenChanged.connect(cls._invalidate_screen)
+                cls._app_hooked = True
+            if screen is not cls._hooked_screen:
+                screen.geometryChanged.connect(cls._invalidate_screen)
+                cls._hooked_screen = screen
+
+        return cls._screen_right, cls._screen_top
+
+    @classmethod
+    def _invalidate_screen(cls, *_):
+        """Forget the cached screen corner."""
+        cls._screen_right = cls._screen_top = None
+
+    @classmethod
+    def _animate(cls, notification, start_rect: QRect, end_rect: QRect,
+                 on_finished: Callable = None):
+        """Slide a notification between two rects on the shared animation."""
+        anim = cls._anim
+        if anim is None:
+            anim = cls._anim = QPropertyAnimation()
+            anim.setPropertyName(b"geometry")
+            anim.setDuration(300)
+            anim.finished.connect(cls._on_anim_finished)
+
+        if anim.state() == QAbstractAnimation.State.Running:
+            # Jump the interrupted slide to its end so its toast is not left mid-way
+            anim.stop()
+            target = anim.targetObject()
+            if target is not None:
+                target.setGeometry(anim.endValue())
+            cls._on_anim_finished()
+
+        anim.setTargetObject(notification)
+        anim.setStartValue(start_rect)
+        anim.setEndValue(end_rect)
+        cls._anim_on_finished = on_finished
+        anim.start()
+
+    @classmethod
+    def _on_anim_finished(cls):
+        """Run the completion callback of the slide that just ended."""
+        callback, cls._anim_on_finished = cls._anim_on_finished, None
+        if callback is not None:
+            callback()
 
     @classmethod
     def _cleanup_notification(cls, notification):
-        """Clean up notification reference."""
+        """Return a hidden notification to the pool for reuse."""
         if notification in cls._notifications:
             cls._notifications.remove(notification)
 
+        pool = cls._pool.setdefault(notification.level, [])
+        if len(pool) < cls._POOL_SIZE:
+            pool.append(notification)
+        else:
+            notification.deleteLater()
+
     @classmethod
-    def show_error(cls, title: str, message: str, details: str = None, parent=None):
-        """Show an error dialog."""
+    def show_error(cls, title: str, message: str,
+                   details: Union[str, Callable[[], str]] = None, parent=None):
+        """Show an error dialog; details may be a callable producing the text."""
         dialog = ErrorDialog(title, message, details, parent)
         dialog.exec()
 
@@ -371,7 +519,7 @@ def handle_exception(func):
             # Show user-friendly error
             error_title = f"Error in {func.__name__.replace('_', ' ').title()}"
             error_message = get_user_friendly_message(e)
-            error_details = traceback.format_exc()
+            error_details = partial(_format_traceback, *sys.exc_info())
 
             NotificationManager.show_error(error_title, error_message, error_details)
 
@@ -381,43 +529,76 @@ def handle_exception(func):
     return wrapper
 
 
+# User-facing messages keyed by exception type; looked up along the MRO
+_ERROR_MESSAGES = {
+    FileNotFoundError: "A required file was not found. Please check your installation.",
+    PermissionError: "Permission denied. Please check file permissions or run as administrator.",
+    ConnectionError: "Network connection error. Please check your internet connection.",
+    ImportError: "Missing required component. Please reinstall the application.",
+    KeyError: "Configuration error. Please check your settings.",
+    ValueError: "Invalid input value. Please check your input and try again.",
+    TimeoutError: "Operation timed out. Please try again.",
+    MemoryError: "Not enough memory to complete the operation.",
+    OSError: "System error occurred. Please try again.",
+}
+
+
+def _format_traceback(exc_type, exc_value, exc_traceback) -> str:
+    """Format an exception the way traceback.format_exc() would."""
+    return ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+
+
 def get_user_friendly_message(exception: Exception) -> str:
     """Convert technical exceptions to user-friendly messages."""
-    error_messages = {
-        FileNotFoundError: "A required file was not found. Please check your installation.",
-        PermissionError: "Permission denied. Please check file permissions or run as administrator.",
-        ConnectionError: "Network connection error. Please check your internet connection.",
-        ImportError: "Missing required component. Please reinstall the application.",
-        KeyError: "Configuration error. Please check your settings.",
-        ValueError: "Invalid input value. Please check your input and try again.",
-        TimeoutError: "Operation timed out. Please try again.",
-        MemoryError: "Not enough memory to complete the operation.",
-        OSError: "System error occurred. Please try again.",
-    }
-
-    # Check for specific exception types
-    for exc_type, message in error_messages.items():
-        if isinstance(exception, exc_type):
+    # The most specific known base class wins
+    for exc_type in type(exception).__mro__:
+        message = _ERROR_MESSAGES.get(exc_type)
+        if message:
             return message
 
     # Default message
     return "An unexpected error occurred. Please try again or contact support if the problem persists."
 
 
+# Minimum time between progress emits, about one frame
+_PROGRESS_EMIT_INTERVAL = 0.016
+
+
 class ProgressFeedback(QObject):
     """Progress feedback system for long-running operations."""
 
     progress_updated = pyqtSignal(int)  # percentage
     status_updated = pyqtSignal(str)  # status message
     completed = pyqtSignal(bool)  # success/failure
+    _trailing_requested = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.progress_dialog = None
         self.current_progress = 0
+        self._pending_status = None
+
+        # Bursts of updates are throttled by time, so callers on worker
+        # threads or in blocking loops still get emits
+        self._last_emit = 0.0
+        self._dirty = False
+
+        # Updates inside the throttle window are flushed by a trailing timer.
+        # The timer lives on this object's thread, so other threads arm it
+        # through a queued signal
+        self._trailing_scheduled = False
+        self._trailing_timer = QTimer(self)
+        self._trailing_timer.setSingleShot(True)
+        self._trailing_timer.timeout.connect(self._flush_trailing)
+        self._trailing_requested.connect(self._start_trailing, Qt.ConnectionType.QueuedConnection)
 
     def start_operation(self, title: str, message: str, can_cancel: bool = False):
         """Start a progress operation."""
+        self.current_progress = 0
+        self._pending_status = None
+        self._last_emit = 0.0
+        self._dirty = False
+
         self.progress_dialog = self.create_progress_dialog(title, message, can_cancel)
         self.progress_dialog.show()
 
@@ -458,20 +639,57 @@ class ProgressFeedback(QObject):
 
     def update_progress(self, percentage: int, status: str = None):
         """Update progress."""
-        self.current_progress = max(0, min(100, percentage))
-        self.progress_updated.emit(self.current_progress)
+        percentage = max(0, min(100, percentage))
+        if percentage == self.current_progress and status is None:
+            return
 
+        self.current_progress = percentage
         if status:
-            self.status_updated.emit(status)
+            self._pending_status = status
+        self._dirty = True
+
+        # Emit at most once per frame; later updates wait for the trailing flush
+        if time.monotonic() - self._last_emit >= _PROGRESS_EMIT_INTERVAL:
+            self._flush_progress()
+        elif not self._trailing_scheduled:
+            self._trailing_scheduled = True
+            self._trailing_requested.emit()
+
+    @pyqtSlot()
+    def _start_trailing(self):
+        """Arm the trailing flush for the end of the current throttle window."""
+        remaining = _PROGRESS_EMIT_INTERVAL - (time.monotonic() - self._last_emit)
+        self._trailing_timer.start(max(0, round(remaining * 1000)))
+
+    @pyqtSlot()
+    def _flush_trailing(self):
+        """Emit an update that arrived inside the throttle window."""
+        self._trailing_scheduled = False
+        if self._dirty:
+            self._flush_progress()
+
+    def _flush_progress(self):
+        """Emit the latest progress and status."""
+        self._last_emit = time.monotonic()
+        self._dirty = False
+        self.progress_updated.emit(self.current_progress)
+
+        if self._pending_status:
+            self.status_updated.emit(self._pending_status)
+            self._pending_status = None
 
     def complete_operation(self, success: bool, message: str = None):
         """Complete the operation."""
+        if self._dirty:
+            self._flush_progress()
+
         self.completed.emit(success)
 
         if message:
             level = NotificationLevel.SUCCESS if success else NotificationLevel.ERROR
             NotificationManager.show_toast(message, level)
 
+    @pyqtSlot(bool)
     def on_operation_completed(self, success: bool):
         """Handle operation completion."""
         if self.progress_dialog:
@@ -480,10 +698,65 @@ class ProgressFeedback(QObject):
 
 
 # Global exception handler
+# Unhandled exceptions closer together than this are folded into one dialog
+_ERROR_DIALOG_WINDOW = 2.0
+
+
 def setup_global_exception_handler():
     """Setup global exception handler for unhandled exceptions."""
+    error_title = "Unexpected Error"
+    last_shown = float('-inf')
+    showing = False
+    flush_scheduled = False
+    suppressed = 0
+    latest = None
+
+    def show_dialog(message: str, details: Callable[[], str]):
+        nonlocal showing, last_shown
+        showing = True
+        last_shown = time.monotonic()
+        try:
+            NotificationManager.show_error(error_title, message, details)
+        except Exception:
+            # Fallback to basic message box if notification system fails
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Icon.Critical)
+            msg.setWindowTitle(error_title)
+            msg.setText(message)
+            msg.exec()
+        finally:
+            showing = False
+            last_shown = time.monotonic()
+
+        # Errors raised while the dialog was open get their own summary later
+        if suppressed:
+            schedule_summary()
+
+    def schedule_summary():
+        nonlocal flush_scheduled
+        if flush_scheduled or QApplication.instance() is None:
+            return
+        flush_scheduled = True
+        remaining = max(0.0, last_shown + _ERROR_DIALOG_WINDOW - time.monotonic())
+        QTimer.singleShot(int(remaining * 1000), show_summary)
+
+    def show_summary():
+        nonlocal flush_scheduled, suppressed, latest
+        flush_scheduled = False
+        if not suppressed or showing:
+            return
+
+        count, (message, details) = suppressed, latest
+        suppressed, latest = 0, None
+        noun = "error" if count == 1 else "errors"
+        show_dialog(
+            f"{count} more {noun} occurred in the last {_ERROR_DIALOG_WINDOW:g} seconds.\n\n"
+            f"Most recent: {message}",
+            details
+        )
 
     def exception_handler(exc_type, exc_value, exc_traceback):
+        nonlocal suppressed, latest
         if issubclass(exc_type, KeyboardInterrupt):
             sys.__excepthook__(exc_type, exc_value, exc_traceback)
             return
@@ -495,19 +768,18 @@ def setup_global_exception_handler():
         )
 
         # Show error dialog
-        error_title = "Unexpected Error"
         error_message = get_user_friendly_message(exc_value)
-        error_details = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        error_details = partial(_format_traceback, exc_type, exc_value, exc_traceback)
+
+        if showing or time.monotonic() - last_shown < _ERROR_DIALOG_WINDOW:
+            # Part of a burst: count it and summarize once the window closes
+            suppressed += 1
+            latest = (error_message, error_details)
+            if not showing:
+                schedule_summary()
+            return
 
-        try:
-            NotificationManager.show_error(error_title, error_message, error_details)
-        except:
-            # Fallback to basic message box if notification system fails
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Icon.Critical)
-            msg.setWindowTitle(error_title)
-            msg.setText(error_message)
-            msg.exec()
+        show_dialog(error_message, error_details)
 
     sys.excepthook = exception_handler
 
@@ -1,11 +1,27 @@
 import os
+import copy
+import errno
 import shutil
+import stat as _stat
 import json
-import yaml
-import csv
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Union, Optional
+from typing import Any, Callable, Dict, Iterator, List, Union, Optional
 from datetime import datetime
+from functools import lru_cache
+
+# Parsed YAML keyed by (path, mtime_ns, size); oldest evicted first. JSON is
+# not cached: json.load is faster than a lookup plus a deep copy of the result
+_PARSE_CACHE_SIZE = 128
+_parse_cache: 'OrderedDict[tuple, Any]' = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader():
+    """Import PyYAML on first use and pick its fastest safe loader."""
+    import yaml
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 class FileHelper:
@@ -18,8 +34,12 @@ class FileHelper:
         """Read content from a file"""
         try:
             file_path = Path(file_path)
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
+            # One sized read and one decode instead of a TextIOWrapper per call
+            content = file_path.read_bytes().decode(encoding)
+            if '\r' in content:
+                # Keep text mode's universal newline behaviour
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return content
         except Exception as e:
             raise FileNotFoundError(f"Error reading file {file_path}: {str(e)}")
 
@@ -36,37 +56,95 @@ class FileHelper:
             print(f"Error writing file {file_path}: {str(e)}")
             return False
 
+    def _read_cached(self, file_path: Union[str, Path],
+                     parse: Callable[[Path], Any]) -> Any:
+        """Parse a file, reusing the last result while its mtime and size match"""
+        try:
+            path = Path(file_path).resolve()
+            stat = path.stat()
+        except OSError as e:
+            raise FileNotFoundError(f"Error reading file {file_path}: {str(e)}")
+
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        try:
+            data = _parse_cache[key]
+            _parse_cache.move_to_end(key)
+        except KeyError:
+            data = parse(path)
+            _parse_cache[key] = data
+            if len(_parse_cache) > _PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+
+        # Callers may mutate the result, so never hand out the cached object
+        return copy.deepcopy(data)
+
     def read_json(self, file_path: Union[str, Path]) -> Dict:
         """Read JSON file"""
+        return self._parse_json(Path(file_path))
+
+    @staticmethod
+    def _parse_json(file_path: Path) -> Any:
         try:
-            content = self.read_file(file_path)
-            return json.loads(content)
+            # Binary mode lets json detect the encoding without a decoded copy
+            with open(file_path, 'rb') as f:
+                return json.load(f)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {file_path}: {str(e)}")
+        except OSError as e:
+            raise FileNotFoundError(f"Error reading file {file_path}: {str(e)}")
 
     def write_json(self, file_path: Union[str, Path],
                    data: Dict, pretty: bool = True) -> bool:
         """Write JSON file"""
         try:
-            content = json.dumps(data, indent=4 if pretty else None)
-            return self.write_file(file_path, content)
+            self._dump_to_file(file_path, lambda f: json.dump(
+                data, f,
+                indent=4 if pretty else None,
+                separators=(',', ': ') if pretty else (',', ':'),
+                ensure_ascii=False
+            ))
+            return True
         except Exception as e:
             print(f"Error writing JSON to {file_path}: {str(e)}")
             return False
 
+    @staticmethod
+    def _dump_to_file(file_path: Union[str, Path], dump: Callable[[Any], None]):
+        """Serialize straight into a sibling temp file, then swap it into place"""
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                dump(f)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def read_yaml(self, file_path: Union[str, Path]) -> Dict:
         """Read YAML file"""
+        return self._read_cached(file_path, self._parse_yaml)
+
+    @staticmethod
+    def _parse_yaml(file_path: Path) -> Any:
+        import yaml
+
         try:
-            content = self.read_file(file_path)
-            return yaml.safe_load(content)
+            with open(file_path, 'rb') as f:
+                return yaml.load(f, Loader=_yaml_loader())
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {file_path}: {str(e)}")
+        except OSError as e:
+            raise FileNotFoundError(f"Error reading file {file_path}: {str(e)}")
 
     def write_yaml(self, file_path: Union[str, Path], data: Dict) -> bool:
         """Write YAML file"""
+        import yaml
+
         try:
-            content = yaml.dump(data, default_flow_style=False)
-            return self.write_file(file_path, content)
+            self._dump_to_file(file_path, lambda f: yaml.dump(data, f, default_flow_style=False))
+            return True
         except Exception as e:
             print(f"Error writing YAML to {file_path}: {str(e)}")
             return False
@@ -74,28 +152,54 @@ class FileHelper:
     def read_csv(self, file_path: Union[str, Path],
                  has_header: bool = True) -> List[Dict]:
         """Read CSV file"""
+        import csv
+
         try:
             with open(file_path, 'r', newline='') as f:
                 if has_header:
                     reader = csv.DictReader(f)
                     return list(reader)
                 else:
-                    reader = csv.reader(f)
-                    return [row for row in reader]
+                    return list(csv.reader(f))
+        except Exception as e:
+            raise ValueError(f"Error reading CSV {file_path}: {str(e)}")
+
+    def iter_csv(self, file_path: Union[str, Path],
+                 has_header: bool = True) -> Iterator[Union[Dict, List[str]]]:
+        """Yield CSV rows one at a time without holding the whole file"""
+        import csv
+
+        try:
+            with open(file_path, 'r', newline='') as f:
+                reader = csv.DictReader(f) if has_header else csv.reader(f)
+                yield from reader
         except Exception as e:
             raise ValueError(f"Error reading CSV {file_path}: {str(e)}")
 
     def write_csv(self, file_path: Union[str, Path],
                   data: List[Dict], fieldnames: Optional[List[str]] = None) -> bool:
         """Write CSV file"""
+        import csv
+
         try:
             if not fieldnames and data:
                 fieldnames = list(data[0].keys())
 
+            # Positional rows skip DictWriter's per-row dict-to-list conversion,
+            # but keep its refusal to drop keys missing from fieldnames
+            known = set(fieldnames)
+            rows = []
+            for row in data:
+                wrong_fields = row.keys() - known
+                if wrong_fields:
+                    raise ValueError("dict contains fields not in fieldnames: "
+                                     + ", ".join(repr(x) for x in wrong_fields))
+                rows.append(tuple(row.get(key) for key in fieldnames))
+
             with open(file_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(rows)
             return True
         except Exception as e:
             print(f"Error writing CSV to {file_path}: {str(e)}")
@@ -113,23 +217,35 @@ class FileHelper:
 
     def cleanup_temp_files(self, max_age_days: int = 1):
         """Clean up old temporary files"""
+        # scandir entries carry cached file type, so only mtime costs a stat
+        cutoff = time.time() - max_age_days * 86400
         try:
-            current_time = datetime.now()
-            for file_path in self.temp_dir.glob('*'):
-                if file_path.is_file():
-                    file_age = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    age_days = (current_time - file_age).days
-
-                    if age_days >= max_age_days:
-                        file_path.unlink()
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime <= cutoff:
+                            os.unlink(entry.path)
+                    except FileNotFoundError:
+                        # Removed by someone else since the directory was listed
+                        continue
+        except FileNotFoundError:
+            # No temp directory means nothing to clean up
+            return
         except Exception as e:
             print(f"Error cleaning up temp files: {str(e)}")
 
     def copy_file(self, source: Union[str, Path],
-                  destination: Union[str, Path]) -> bool:
+                  destination: Union[str, Path],
+                  preserve_metadata: bool = False) -> bool:
         """Copy a file"""
         try:
-            shutil.copy2(source, destination)
+            if preserve_metadata:
+                shutil.copy2(source, destination)
+            else:
+                # copyfile skips the stat/utime/chmod round trips and can use sendfile
+                if os.path.isdir(destination):
+                    destination = os.path.join(destination, os.path.basename(source))
+                shutil.copyfile(source, destination)
             return True
         except Exception as e:
             print(f"Error copying file from {source} to {destination}: {str(e)}")
@@ -139,7 +255,19 @@ class FileHelper:
                   destination: Union[str, Path]) -> bool:
         """Move a file"""
         try:
-            shutil.move(source, destination)
+            target = destination
+            if os.path.isdir(destination):
+                # Like shutil.move, never overwrite a file inside a directory target
+                target = os.path.join(destination, os.path.basename(source))
+                if os.path.lexists(target):
+                    raise shutil.Error(f"Destination path '{target}' already exists")
+            try:
+                # A single atomic rename when both paths share a filesystem
+                os.replace(source, target)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source, target)
             return True
         except Exception as e:
             print(f"Error moving file from {source} to {destination}: {str(e)}")
@@ -186,8 +314,9 @@ class FileHelper:
                 'size': stat.st_size,
                 'created': datetime.fromtimestamp(stat.st_ctime),
                 'modified': datetime.fromtimestamp(stat.st_mtime),
-                'is_file': path.is_file(),
-                'is_directory': path.is_directory()
+                # Derived from the one stat() above rather than stat-ing again
+                'is_file': _stat.S_ISREG(stat.st_mode),
+                'is_directory': _stat.S_ISDIR(stat.st_mode)
             }
         except Exception as e:
             print(f"Error getting file info for {file_path}: {str(e)}")
@@ -1,73 +1,128 @@
 import re
-from typing import List, Optional
+from typing import List, Optional, Union
 import difflib
+import functools
 import unicodedata
 import html
+import traceback
 
+# Patterns used by the StringHelper methods, compiled once at import
+_CODE_BLOCK_RE = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
+_DANGEROUS_RE = re.compile(
+    r'<(script|style|iframe|object|embed)\b[^>]*>.*?</\1\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+_NON_WORD_RE = re.compile(r'[^\w\s-]+')
+_WS_RE = re.compile(r'\s+')
+_SLUG_SEPARATOR_RE = re.compile(r'[\s-]+')
+_VAR_KEYWORDS = ('var', 'let', 'const', 'int', 'float', 'string', 'bool', 'double')
+_VAR_RE = re.compile(r'\b(?:%s)\s+(\w+)\b' % '|'.join(_VAR_KEYWORDS))
+_JAVA_CLASS_RE = re.compile(r'public\s+class\s+\w+\s*\{')
+_JAVA_MAIN_RE = re.compile(r'public\s+static\s+void\s+main\s*\(')
+
+# Spaces become underscores and characters invalid in filenames are dropped
+_FILENAME_TABLE = str.maketrans(' ', '_', '<>:"/\\|?*')
+
+# Statements after which format_code dedents
+_DEDENT_STATEMENTS = frozenset(('break', 'continue', 'pass', 'return'))
+
+
+def _as_lines(text: Union[str, List[str]]) -> List[str]:
+    """Return text as a list of lines, passing through an already split list"""
+    return text if isinstance(text, list) else text.splitlines()
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_code(code: str) -> str:
+    """Lowercase code and collapse all whitespace runs to single spaces"""
+    return ' '.join(code.lower().split())
 
 class StringHelper:
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename by removing invalid characters"""
-        # Remove invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '')
-
-        # Replace spaces with underscores
-        filename = filename.replace(' ', '_')
+        # Remove invalid characters and replace spaces with underscores
+        filename = filename.translate(_FILENAME_TABLE)
 
         # Remove any non-ASCII characters
-        filename = ''.join(c for c in filename if ord(c) < 128)
+        filename = filename.encode('ascii', 'ignore').decode('ascii')
 
         return filename.strip('._')
 
     @staticmethod
-    def format_code(code: str, language: str) -> str:
-        """Format code for display"""
-        # Remove excess whitespace
-        code = code.strip()
-
-        # Add language-specific formatting
-        if language == 'python':
-            # Ensure proper indentation (4 spaces)
+    def format_code(code: Union[str, List[str]], language: str) -> str:
+        """Format code for display; code may also be given as a list of lines"""
+        if isinstance(code, list):
+            # Drop the blank lines that stripping the joined text would remove
+            start, end = 0, len(code)
+            while start < end and not code[start].strip():
+                start += 1
+            while end > start and not code[end - 1].strip():
+                end -= 1
+            lines = code[start:end] or ['']
+            if language != 'python':
+                return '\n'.join(lines).strip()
+        else:
+            # Remove excess whitespace
+            code = code.strip()
+            if language != 'python':
+                return code
             lines = code.split('\n')
-            formatted_lines = []
-            indent_level = 0
 
-            for line in lines:
-                stripped = line.strip()
+        # Python: ensure proper indentation (4 spaces)
+        formatted_lines = []
+        append = formatted_lines.append
+        indent_level = 0
+        # Indent strings by level, built on demand for this call only
+        indents = ['']
 
-                # Adjust indent level based on content
-                if stripped.endswith(':'):
-                    formatted_lines.append('    ' * indent_level + stripped)
-                    indent_level += 1
-                elif stripped in ['break', 'continue', 'pass', 'return']:
-                    formatted_lines.append('    ' * indent_level + stripped)
-                    if indent_level > 0:
-                        indent_level -= 1
-                else:
-                    formatted_lines.append('    ' * indent_level + stripped)
+        for line in lines:
+            stripped = line.strip()
+            append(indents[indent_level] + stripped)
 
-            code = '\n'.join(formatted_lines)
+            # Adjust indent level based on content
+            if stripped.endswith(':'):
+                indent_level += 1
+                if indent_level == len(indents):
+                    indents.append(indents[-1] + '    ')
+            elif stripped in _DEDENT_STATEMENTS and indent_level > 0:
+                indent_level -= 1
 
-        return code
+        return '\n'.join(formatted_lines)
 
     @staticmethod
-    def compare_code(code1: str, code2: str) -> float:
-        """Compare similarity between two code snippets"""
-        # Remove whitespace and convert to lowercase for comparison
-        code1_clean = ' '.join(code1.lower().split())
-        code2_clean = ' '.join(code2.lower().split())
-
-        # Use difflib to calculate similarity ratio
-        return difflib.SequenceMatcher(None, code1_clean, code2_clean).ratio()
+    def compare_code(code1: str, code2: str, threshold: float = 0.0) -> float:
+        """Compare similarity between two code snippets
+
+        When the similarity is certainly below ``threshold`` a cheap upper
+        bound is returned instead of the exact ratio.
+        """
+        # Identical input needs neither normalization nor matching
+        if code1 == code2:
+            return 1.0
+
+        # Remove whitespace and convert to lowercase for comparison; cached so a
+        # reference snippet compared against many submissions is normalized once
+        code1_clean = _normalize_code(code1)
+        code2_clean = _normalize_code(code2)
+
+        if code1_clean == code2_clean:
+            return 1.0
+
+        # Use difflib to calculate similarity ratio, trying its cheap upper bounds first
+        matcher = difflib.SequenceMatcher(None, code1_clean, code2_clean)
+        upper = matcher.real_quick_ratio()
+        if upper < threshold:
+            return upper
+        upper = matcher.quick_ratio()
+        if upper < threshold:
+            return upper
+        return matcher.ratio()
 
     @staticmethod
     def extract_code_blocks(markdown: str) -> List[dict]:
         """Extract code blocks from markdown text"""
-        pattern = r'```(\w+)?\n(.*?)\n```'
-        matches = re.finditer(pattern, markdown, re.DOTALL)
+        matches = _CODE_BLOCK_RE.finditer(markdown)
 
         code_blocks = []
         for match in matches:
@@ -83,15 +138,12 @@ class StringHelper:
     @staticmethod
     def sanitize_html(content: str) -> str:
         """Sanitize HTML content"""
-        # Convert special characters to HTML entities
-        content = html.escape(content)
+        # Remove potentially dangerous elements in one pass; this has to happen
+        # before escaping, which turns every '<' into '&lt;'
+        content = _DANGEROUS_RE.sub('', content)
 
-        # Remove potentially dangerous tags and attributes
-        dangerous_tags = ['script', 'style', 'iframe', 'object', 'embed']
-        for tag in dangerous_tags:
-            content = re.sub(f'<{tag}.*?</{tag}>', '', content, flags=re.DOTALL)
-
-        return content
+        # Convert special characters to HTML entities
+        return html.escape(content)
 
     @staticmethod
     def truncate_text(text: str, max_length: int,
@@ -105,53 +157,82 @@ class StringHelper:
     @staticmethod
     def normalize_text(text: str) -> str:
         """Normalize text by removing special characters and extra whitespace"""
-        # Convert to NFKD form and remove diacritics
-        text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
+        # Convert to NFKD form and remove diacritics; ASCII input is already in that form
+        if not text.isascii():
+            text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
 
         # Remove special characters and extra whitespace
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _NON_WORD_RE.sub('', text)
+        text = _WS_RE.sub(' ', text)
 
         return text.strip()
 
     @staticmethod
     def generate_slug(text: str) -> str:
         """Generate URL-friendly slug from text"""
-        # Normalize text
-        text = StringHelper.normalize_text(text.lower())
+        # Convert to NFKD form and remove diacritics, as normalize_text does
+        text = text.lower()
+        if not text.isascii():
+            text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
 
-        # Replace spaces with hyphens
-        text = text.replace(' ', '-')
-
-        # Remove consecutive hyphens
-        text = re.sub(r'-+', '-', text)
+        # Remove special characters, then turn each run of spaces and hyphens
+        # into a single hyphen
+        text = _NON_WORD_RE.sub('', text)
+        text = _SLUG_SEPARATOR_RE.sub('-', text)
 
         return text.strip('-')
 
     @staticmethod
-    def highlight_differences(text1: str, text2: str) -> tuple:
-        """Highlight differences between two texts"""
-        differ = difflib.Differ()
-        diff = list(differ.compare(text1.splitlines(), text2.splitlines()))
+    def highlight_differences(text1: Union[str, List[str]],
+                              text2: Union[str, List[str]]) -> tuple:
+        """Highlight differences between two texts or lists of lines"""
+        if text1 == text2:
+            return [], []
+
+        # Line-level opcodes give Differ's lists without its intraline hints; autojunk
+        # is off so repeated lines in long texts still match
+        lines1 = _as_lines(text1)
+        lines2 = _as_lines(text2)
+        matcher = difflib.SequenceMatcher(None, lines1, lines2, autojunk=False)
 
         additions = []
         deletions = []
 
-        for line in diff:
-            if line.startswith('+'):
-                additions.append(line[2:])
-            elif line.startswith('-'):
-                deletions.append(line[2:])
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            if tag != 'insert':
+                deletions.extend(lines1[i1:i2])
+            if tag != 'delete':
+                additions.extend(lines2[j1:j2])
 
         return additions, deletions
 
     @staticmethod
     def extract_variables(code: str) -> List[str]:
         """Extract variable names from code"""
-        # This is a simple implementation; might need adjustment based on language
-        pattern = r'\b(?:var|let|const|int|float|string|bool|double)\s+(\w+)\b'
-        matches = re.finditer(pattern, code)
-        return [match.group(1) for match in matches]
+        # This is a simple implementation; might need adjustment based on language.
+        # The regex has no literal prefix, so find keyword hits with str.find and
+        # only run it at those offsets
+        hits = []
+        for keyword in _VAR_KEYWORDS:
+            i = code.find(keyword)
+            while i != -1:
+                hits.append(i)
+                i = code.find(keyword, i + 1)
+        hits.sort()
+
+        # Skip hits inside an earlier match, as finditer would
+        variables = []
+        end = 0
+        for i in hits:
+            if i < end:
+                continue
+            match = _VAR_RE.match(code, i)
+            if match:
+                variables.append(match.group(1))
+                end = match.end()
+        return variables
 
     @staticmethod
     def format_error_message(error: Exception) -> str:
@@ -161,9 +242,10 @@ class StringHelper:
 
         # Format traceback if available
         if hasattr(error, '__traceback__'):
-            import traceback
-            tb = ''.join(traceback.format_tb(error.__traceback__))
-            return f"{error_type}: {error_message}\n\nTraceback:\n{tb}"
+            # Join header and frames once rather than joining the frames first
+            parts = [f"{error_type}: {error_message}\n\nTraceback:\n"]
+            parts.extend(traceback.format_tb(error.__traceback__))
+            return ''.join(parts)
 
         return f"{error_type}: {error_message}"
 
@@ -179,10 +261,8 @@ class StringHelper:
                 return False
         elif language == 'java':
             # Check for basic Java class structure
-            class_pattern = r'public\s+class\s+\w+\s*\{'
-            method_pattern = r'public\s+static\s+void\s+main\s*\('
-            return bool(re.search(class_pattern, code) and
-                        re.search(method_pattern, code))
+            return bool(_JAVA_CLASS_RE.search(code) and
+                        _JAVA_MAIN_RE.search(code))
 
         return True  # Default to true for other languages
 
@@ -196,33 +276,42 @@ class StringHelper:
                                 text[pos] not in reverse_brackets):
             return None
 
-        stack = []
-
         if text[pos] in brackets:
             # Forward search
             opening = text[pos]
             closing = brackets[opening]
 
+            # Without nesting the first closing bracket is the match
+            if text.find(opening, pos + 1) < 0:
+                match = text.find(closing, pos + 1)
+                return match if match >= 0 else None
+
+            depth = 0
             for i in range(pos, len(text)):
-                if text[i] == opening:
-                    stack.append(i)
-                elif text[i] == closing:
-                    if not stack:
-                        return None
-                    if stack.pop() == pos:
+                c = text[i]
+                if c == opening:
+                    depth += 1
+                elif c == closing:
+                    depth -= 1
+                    if depth == 0:
                         return i
         else:
             # Backward search
             closing = text[pos]
             opening = reverse_brackets[closing]
 
+            if text.rfind(closing, 0, pos) < 0:
+                match = text.rfind(opening, 0, pos)
+                return match if match >= 0 else None
+
+            depth = 0
             for i in range(pos, -1, -1):
-                if text[i] == closing:
-                    stack.append(i)
-                elif text[i] == opening:
-                    if not stack:
-                        return None
-                    if stack.pop() == pos:
+                c = text[i]
+                if c == closing:
+                    depth += 1
+                elif c == opening:
+                    depth -= 1
+                    if depth == 0:
                         return i
 
-        return None
\ No newline at end of file
+        return None
@@ -3,13 +3,18 @@ Comprehensive logging setup for Tutorial Agent
 
 This module provides centralized logging configuration with support for
 file and console output, log rotation, and different log levels.
+
+Loggers cache their level checks, so in hot loops guard expensive message
+arguments with ``if logger.isEnabledFor(logging.DEBUG):`` rather than
+building them for a record that will be dropped.
 """
 
 import logging
 import logging.handlers
+import platform
 import sys
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 from datetime import datetime
 
 
@@ -26,15 +31,22 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        reset = self.COLORS['RESET']
+        self._colored = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+    
     def format(self, record):
-        # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[record.levelname]}{record.levelname}"
-                f"{self.COLORS['RESET']}"
-            )
-        
-        return super().format(record)
+        # Add color to levelname, restoring it so other handlers see it plain
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -44,7 +56,8 @@ def setup_logging(
     backup_count: int = 5,
     console_output: bool = True,
     colored_console: bool = True,
-    format_string: Optional[str] = None
+    format_string: Optional[str] = None,
+    quiet_loggers: Iterable[str] = ('PyQt6', 'urllib3', 'requests')
 ) -> logging.Logger:
     """
     Set up comprehensive logging configuration.
@@ -57,6 +70,7 @@ def setup_logging(
         console_output: Whether to output to console
         colored_console: Whether to use colored output in console
         format_string: Custom format string
+        quiet_loggers: Third-party loggers limited to WARNING and above
     
     Returns:
         Configured root logger
@@ -108,9 +122,8 @@ def setup_logging(
     
     # Set up specific logger levels
     logging.getLogger('TutorialAgent').setLevel(level)
-    logging.getLogger('PyQt6').setLevel(logging.WARNING)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
+    for name in quiet_loggers:
+        logging.getLogger(name).setLevel(logging.WARNING)
     
     # Log the setup
     logger = logging.getLogger('TutorialAgent.LoggingSetup')
@@ -155,8 +168,9 @@ def log_system_info():
     """Log system information for debugging purposes."""
     logger = logging.getLogger('TutorialAgent.SystemInfo')
     
-    import platform
-    import sys
+    # platform.processor() can spawn a subprocess; skip it all when INFO is off
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     logger.info("System Information:")
     logger.info(f"  Platform: {platform.platform()}")
@@ -175,6 +189,10 @@ def create_performance_logger() -> logging.Logger:
     """Create a dedicated logger for performance monitoring."""
     perf_logger = logging.getLogger('TutorialAgent.Performance')
     
+    # Already set up; another handler would emit every record twice
+    if perf_logger.handlers:
+        return perf_logger
+    
     # Create a separate handler for performance logs
     perf_handler = logging.StreamHandler()
     perf_handler.setLevel(logging.DEBUG)
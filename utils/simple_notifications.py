@@ -3,6 +3,8 @@
 from PyQt6.QtWidgets import QFrame, QLabel, QHBoxLayout, QPushButton, QApplication, QWidget
 from PyQt6.QtCore import Qt, QTimer
 import logging
+import time
+from typing import Dict
 
 logger = logging.getLogger('TutorialAgent.Notifications')
 
@@ -108,18 +110,45 @@ class SimpleToast(QFrame):
         self.timer.start(3000)
 
 
-# Global toast storage to prevent garbage collection
-_active_toasts = []
+# Global toast storage to prevent garbage collection, keyed by id(toast)
+_active_toasts: Dict[int, SimpleToast] = {}
+
+# One timer releases every expired toast instead of a singleShot per toast
+_TOAST_LIFETIME = 4.0
+_cleanup_timer = None
+
+
+def _track_toast(toast: SimpleToast):
+    """Keep a reference to toast until its lifetime has passed."""
+    global _cleanup_timer
+
+    toast._expires_at = time.monotonic() + _TOAST_LIFETIME
+    _active_toasts[id(toast)] = toast
+
+    if _cleanup_timer is None:
+        _cleanup_timer = QTimer()
+        _cleanup_timer.setInterval(500)
+        _cleanup_timer.timeout.connect(_sweep_toasts)
+    if not _cleanup_timer.isActive():
+        _cleanup_timer.start()
+
+
+def _sweep_toasts():
+    """Drop references to expired toasts and stop once none are left."""
+    now = time.monotonic()
+    expired = [key for key, toast in _active_toasts.items() if toast._expires_at <= now]
+    for key in expired:
+        del _active_toasts[key]
+
+    if not _active_toasts:
+        _cleanup_timer.stop()
 
 
 def show_success(message: str, parent: QWidget = None):
     """Show success toast notification."""
     toast = SimpleToast(message, "success")
     toast.show_toast(parent)
-    _active_toasts.append(toast)
-
-    # Clean up reference after 4 seconds
-    QTimer.singleShot(4000, lambda: _cleanup_toast(toast))
+    _track_toast(toast)
 
     logger.info(f"Success: {message}")
 
@@ -128,15 +157,6 @@ def show_error(message: str, parent: QWidget = None):
     """Show error toast notification."""
     toast = SimpleToast(message, "error")
     toast.show_toast(parent)
-    _active_toasts.append(toast)
-
-    # Clean up reference after 4 seconds
-    QTimer.singleShot(4000, lambda: _cleanup_toast(toast))
+    _track_toast(toast)
 
     logger.error(f"Error: {message}")
-
-
-def _cleanup_toast(toast):
-    """Remove toast from active list."""
-    if toast in _active_toasts:
-        _active_toasts.remove(toast)
\ No newline at end of file